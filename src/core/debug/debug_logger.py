@@ -94,6 +94,16 @@ class DebugLogger:
         order = ["NONE", "ERROR", "WARN", "INFO", "VERBOSE"]
         return order.index(level) <= order.index(LoggerConfig.LOG_LEVEL)
 
+    @staticmethod
+    def is_enabled(category: str, level: str = "INFO") -> bool:
+        """
+        Public form of the category/level filter.
+
+        Hot paths resolve this once at import time and guard their calls
+        with the result, so disabled logs never build their f-strings.
+        """
+        return DebugLogger._should_log(category, level)
+
     @staticmethod
     def _log(tag: str, message: str, color: str = "reset",
              category: str = "system", level: str = "INFO",
@@ -101,6 +101,10 @@ class InputManager:
         self._last_raw_move = pygame.Vector2(0, 0)
         self._normalized_dirty = True
 
+        # Pointer position, snapshotted once per update() so consumers
+        # (UI, scenes) read a field instead of calling into pygame again
+        self.mouse_pos = (0, 0)
+
         # Action states (gameplay)
         self.attack_pressed = False
         self.attack_held = False
@@ -159,6 +163,7 @@ class InputManager:
     # ===========================================================
     def update(self):
         """Poll all input sources once per frame."""
+        self.mouse_pos = pygame.mouse.get_pos()
         if self.context == "ui":
             self._update_ui_navigation()
         else:
@@ -35,9 +35,17 @@ import pygame
 from typing import Optional
 from src.core.runtime.game_settings import Layers
 from src.core.debug.debug_logger import DebugLogger
-from src.entities.entity_state import LifecycleState, EntityCategory
+from src.entities.entity_state import CollisionTags, EntityCategory, ShapeData, ALIVE, DYING, DEAD, LIFECYCLE_NAMES
 from src.graphics.animations.animation_controller import AnimationController
 
+# Lifecycle transition tables for mark_dead(): {current_state: next_state}
+_DEATH_NEXT = {ALIVE: DYING, DYING: DEAD, DEAD: DEAD}
+_DEATH_NEXT_IMMEDIATE = {ALIVE: DEAD, DYING: DEAD, DEAD: DEAD}
+
+# Resolved once so mark_dead() skips building its log f-string when the
+# "entity" category is off (it runs at bullet-impact rates).
+DEBUG_ENTITY_STATE = DebugLogger.is_enabled("entity")
+
 
 class BaseEntity:
     """
@@ -54,6 +62,18 @@ class BaseEntity:
     - Should set appropriate layer in __init__ (e.g., Layers.PLAYER)
     """
 
+    # Fixed attribute layout (no per-instance __dict__). Every subclass must
+    # declare its own __slots__ too, or it silently gets a __dict__ back.
+    # Includes attributes written by outside systems (animations, pooling,
+    # collision registration).
+    __slots__ = (
+        "pos", "velocity", "image", "rect", "shape_data", "draw_manager",
+        "death_state", "layer", "category", "collision_tag", "visible",
+        "health", "max_health", "hitbox", "hitbox_scale", "_hitbox_scale",
+        "_current_visual_state", "_visual_state_config", "_cached_health",
+        "_original_image", "_pool_key", "anim", "anim_context",
+    )
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -79,6 +99,7 @@ class BaseEntity:
                     "size": tuple,    # (width, height) in pixels
                     "kwargs": dict    # Optional: {"width": 2} for outline, etc.
                 }
+                Frozen into a ShapeData namedtuple at init.
             draw_manager: DrawManager instance for shape prebaking (optimization).
 
         Rendering Modes:
@@ -112,11 +133,15 @@ class BaseEntity:
         # -------------------------------------------------------
         # Rendering Setup (with auto-optimization)
         # -------------------------------------------------------
+        shape_data = ShapeData.from_dict(shape_data)
+
         # AUTO-OPTIMIZATION: Convert shape to image at creation time
         if image is None and shape_data and draw_manager:
-            self.image = draw_manager.prebake_shape(**shape_data)
+            self.image = draw_manager.prebake_shape(
+                shape_data.type, shape_data.size, shape_data.color, **shape_data.kwargs
+            )
         else:
-            self.image = image
+            self.image = self._ensure_display_format(image)
 
         # -------------------------------------------------------
         # Rect Setup (center-aligned)
@@ -125,7 +150,7 @@ class BaseEntity:
             self.rect = self.image.get_rect(center=(x, y))
         else:
             # Fallback for entities_animation created without draw_manager
-            size = shape_data.get("size", (10, 10)) if shape_data else (10, 10)
+            size = shape_data.size if shape_data else (10, 10)
             self.rect = pygame.Rect(0, 0, *size)
             self.rect.center = (x, y)
             # Store shape data for manual rendering (fallback path)
@@ -136,7 +161,7 @@ class BaseEntity:
         # -------------------------------------------------------
         # Entity State
         # -------------------------------------------------------
-        self.death_state = LifecycleState.ALIVE
+        self.death_state = ALIVE
 
         # Default layer - subclasses SHOULD override this
         self.layer = Layers.ENEMIES
@@ -145,13 +170,38 @@ class BaseEntity:
         # Attributes
         # -------------------------------------------------------
         self.category = EntityCategory.EFFECT
-        self.collision_tag = "neutral"
+        self.collision_tag = CollisionTags.NEUTRAL
 
         self._current_visual_state = None  # Subclasses set initial state
         self._visual_state_config = {}  # Subclasses populate state→image/color mapping
 
         self.anim = AnimationController()
 
+    @staticmethod
+    def _ensure_display_format(image):
+        """
+        Convert surfaces whose pixel format differs from the display's.
+
+        A surface straight from pygame.image.load() forces a pixel-format
+        conversion on every blit. Catch it once here at the entity boundary.
+        Bit depth and RGB masks are compared with the display surface, so
+        surfaces already convert()ed or convert_alpha()ed pass through, and
+        opaque surfaces stay opaque.
+        """
+        if image is None:
+            return image
+        display = pygame.display.get_surface()
+        if display is None:
+            return image  # No display yet (headless/tests) - can't convert
+        if (image.get_bitsize() == display.get_bitsize()
+                and image.get_masks()[:3] == display.get_masks()[:3]):
+            return image
+
+        DebugLogger.warn(f"Unconverted surface {image.get_size()} passed to entity; converting to display format")
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+
     # ===========================================================
     # Spatial Synchronization
     # ===========================================================
@@ -194,20 +244,17 @@ class BaseEntity:
             immediate: If True, skip DYING phase and go directly to DEAD.
         """
         # Ignore if already fully dead
-        if self.death_state == LifecycleState.DEAD:
+        if self.death_state == DEAD:
             return
 
-        if immediate or self.death_state == LifecycleState.DYING:
-            # Finalize death immediately
-            self.death_state = LifecycleState.DEAD
-        else:
-            # Begin death sequence (animation, animation_effects, etc.)
-            self.death_state = LifecycleState.DYING
+        # ALIVE → DYING (death sequence) or DEAD (immediate); DYING → DEAD
+        self.death_state = (_DEATH_NEXT_IMMEDIATE if immediate else _DEATH_NEXT)[self.death_state]
 
-        DebugLogger.state(
-            f"[{type(self).__name__}] → {self.death_state.name}",
-            category="entity"
-        )
+        if DEBUG_ENTITY_STATE:
+            DebugLogger.state(
+                f"[{type(self).__name__}] → {LIFECYCLE_NAMES[self.death_state]}",
+                category="entity"
+            )
 
     def reset(self, x, y, **kwargs):
         """
@@ -215,7 +262,7 @@ class BaseEntity:
         Subclasses override to reset specific attributes.
         """
         self.pos.update(x, y)
-        self.death_state = LifecycleState.ALIVE
+        self.death_state = ALIVE
         self.sync_rect()
 
     # ===========================================================
@@ -242,12 +289,13 @@ class BaseEntity:
             draw_manager.draw_entity(self, self.layer)
         elif hasattr(self, 'shape_data') and self.shape_data:
             # Fallback path: Shape rendering (per-frame, slower)
+            shape = self.shape_data
             draw_manager.queue_shape(
-                self.shape_data["type"],
+                shape.type,
                 self.rect,
-                self.shape_data["color"],
+                shape.color,
                 self.layer,
-                **self.shape_data.get("kwargs", {})
+                **shape.kwargs
             )
         else:
             # Emergency fallback: Debug visualization
@@ -282,8 +330,8 @@ class BaseEntity:
                 return
 
             # Shape mode - rebake
-            shape_type = shape_type or self.shape_data.get("type", "rect")
-            size = size or self.shape_data.get("size", (10, 10))
+            shape_type = shape_type or self.shape_data.type
+            size = size or self.shape_data.size
 
             if hasattr(self, 'draw_manager') and self.draw_manager:
                 self.image = self.draw_manager.prebake_shape(
@@ -6,6 +6,7 @@ Defines the base Bullet class providing shared logic for all bullet types.
 Responsibilities
 ----------------
 - Define position, velocity, and lifespan handling.
+- Keep motion state as raw floats (no Vector2 math in the hot path).
 - Provide update and draw methods for derived bullet classes.
 - Manage per-bullet motion and collision.
 - Defer off-screen cleanup and pooling to BulletManager.
@@ -15,12 +16,18 @@ import pygame
 from src.core.runtime import game_settings
 from src.core.debug.debug_logger import DebugLogger
 from src.entities.base_entity import BaseEntity
-from src.entities.entity_state import LifecycleState, EntityCategory
+from src.entities.entity_state import CollisionTags, EntityCategory, ALIVE, DEAD
+
+# Resolved once so bullet impacts don't format a log line that is filtered out
+DEBUG_COLLISION_STATE = DebugLogger.is_enabled("collision")
 
 
 class BaseBullet(BaseEntity):
     """Base class for all bullet entities_animation."""
 
+    # pos/vel are properties over these floats
+    __slots__ = ("_px", "_py", "_vx", "_vy", "color", "radius", "owner", "damage")
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -60,20 +67,66 @@ class BaseBullet(BaseEntity):
             draw_manager=draw_manager
         )
 
-        # Core attributes
-        self.pos = pygame.Vector2(pos)
-        self.vel = pygame.Vector2(vel)
-        self.death_state = LifecycleState.ALIVE
+        # Core attributes (raw floats, see pos/vel properties)
+        # Position and death_state are already set by BaseEntity.__init__.
+        self.vel = vel
         self.owner = owner
         self.radius = radius
         self.damage = damage
 
         # Collision setup
-        self.collision_tag = f"{owner}_bullet"
+        self.collision_tag = CollisionTags.bullet(owner)
         self.category = EntityCategory.PROJECTILE
         self.hitbox_scale = hitbox_scale
         self.layer = game_settings.Layers.BULLETS
 
+    # ===========================================================
+    # Motion State
+    # ===========================================================
+    @property
+    def pos(self) -> pygame.Vector2:
+        """
+        Current center position as a new Vector2 (read-only snapshot).
+
+        Motion is stored in plain floats (_px, _py) so update() never
+        touches the Vector2 C wrapper. The returned vector is a copy, so
+        edits on it (bullet.pos.x = ..., bullet.pos.update(...)) are lost.
+        Assign instead: bullet.pos = (x, y), or bullet.pos += offset,
+        which goes through the setter.
+        """
+        return pygame.Vector2(self._px, self._py)
+
+    @pos.setter
+    def pos(self, value):
+        self._px = float(value[0])
+        self._py = float(value[1])
+
+    @property
+    def vel(self) -> pygame.Vector2:
+        """
+        Current velocity as a new Vector2 (read-only snapshot).
+
+        Like pos, edits on the returned copy (bullet.vel.x = ...) are
+        lost; assign a new value instead (bullet.vel = (vx, vy)).
+        """
+        return pygame.Vector2(self._vx, self._vy)
+
+    @vel.setter
+    def vel(self, value):
+        self._vx = float(value[0])
+        self._vy = float(value[1])
+
+    def sync_rect(self):
+        """Synchronize rect.center with the raw float position."""
+        self.rect.center = (self._px, self._py)
+
+    def reset(self, x, y, **kwargs):
+        """Reset bullet to reusable state (for pooling)."""
+        self._px = float(x)
+        self._py = float(y)
+        self.death_state = ALIVE
+        self.sync_rect()
+
     # ===========================================================
     # Update Logic
     # ===========================================================
@@ -86,12 +139,13 @@ class BaseBullet(BaseEntity):
             - Sync its rect and hitbox.
             - (Offscreen cleanup handled by BulletManager.)
         """
-        if self.death_state >= LifecycleState.DEAD:
+        if self.death_state >= DEAD:
             return
 
-        # Motion update
-        self.pos += self.vel * dt
-        self.rect.center = self.pos
+        # Motion update (plain float math, no Vector2 temporaries)
+        self._px += self._vx * dt
+        self._py += self._vy * dt
+        self.rect.center = (self._px, self._py)
 
     # ===========================================================
     # Collision Handling
@@ -103,7 +157,7 @@ class BaseBullet(BaseEntity):
         Args:
             target (BaseEntity): The entity that this bullet collided with.
         """
-        if self.death_state >= LifecycleState.DEAD or target is self:
+        if self.death_state >= DEAD or target is self:
             return
         self.handle_collision(target)
 
@@ -118,19 +172,9 @@ class BaseBullet(BaseEntity):
         Subclasses can override to add piercing, explosion, or
         special animation_effects upon impact.
         """
-        self.death_state = LifecycleState.DEAD
-        DebugLogger.state(
-            f"{type(self).__name__} hit {type(target).__name__} → destroyed",
-            category="collision"
-        )
-
-    # ===========================================================
-    # Rendering
-    # ===========================================================
-    def draw(self, draw_manager):
-        """
-        Render the bullet on screen.
-
-        Draws either an image or fallback circle based on render mode.
-        """
-        super().draw(draw_manager)
+        self.death_state = DEAD
+        if DEBUG_COLLISION_STATE:
+            DebugLogger.state(
+                f"{type(self).__name__} hit {type(target).__name__} → destroyed",
+                category="collision"
+            )
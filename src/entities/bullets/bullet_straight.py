@@ -11,11 +11,14 @@ Responsibilities
 """
 
 from src.entities.bullets.base_bullet import BaseBullet
+from src.entities.entity_state import CollisionTags
 
 
 class StraightBullet(BaseBullet):
     """Simple bullet that travels in a straight line."""
 
+    __slots__ = ()
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -24,7 +27,7 @@ class StraightBullet(BaseBullet):
         super().__init__(*args, **kwargs)
 
         # Ensure consistent collision tag
-        self.collision_tag = f"{self.owner}_bullet"
+        self.collision_tag = CollisionTags.bullet(self.owner)
 
         # Optional debug trace
         # DebugLogger.trace(f"[BulletInit] StraightBullet ({self.owner}) created")
@@ -32,28 +35,17 @@ class StraightBullet(BaseBullet):
     # ===========================================================
     # Update Logic
     # ===========================================================
-    def update(self, dt: float):
-        """
-        Move linearly according to BaseBullet velocity.
-        Override if extended behaviors (e.g., trails, acceleration) are added.
-        """
-        super().update(dt)
-
-        # Future extensions:
-        # - Add sprite rotation based on velocity vector.
-        # - Add glow/trail or hit effect emitters.
+    # Inherits BaseBullet.update directly (no pass-through override) so the
+    # per-bullet call dispatches straight to the float motion kernel.
+    # Override only when extended behaviors (e.g., trails, acceleration) are added:
+    # - Add sprite rotation based on velocity vector.
+    # - Add glow/trail or hit effect emitters.
 
     # ===========================================================
     # Rendering
     # ===========================================================
-    def draw(self, draw_manager):
-        """
-        Queue this bullet for rendering via DrawManager.
-
-        Uses BaseBullet's drawing behavior to ensure consistent layering.
-        """
-        super().draw(draw_manager)
-        # Future: Add glow, flicker, or material animation_effects here.
+    # Inherits BaseEntity.draw directly (no pass-through overrides).
+    # Future: Add glow, flicker, or material animation_effects here.
 
 
 from src.entities.entity_registry import EntityRegistry
@@ -14,13 +14,30 @@ import pygame
 from src.core.runtime.game_settings import Display, Layers
 from src.core.debug.debug_logger import DebugLogger
 from src.entities.base_entity import BaseEntity
-from src.entities.entity_state import CollisionTags, LifecycleState, EntityCategory
-from src.graphics.animations.animation_effects.death_animation import death_fade
+from src.entities.entity_state import CollisionTags, EntityCategory, ALIVE, DYING, DEAD
+
+# Bound once at import so the per-frame off-screen check is a global load,
+# not a module → class → attribute chain.
+_DISPLAY_HEIGHT = Display.HEIGHT
+
+# Screen bounds used to skip queuing sprites that would not be visible
+_VIEWPORT = pygame.Rect(0, 0, Display.WIDTH, Display.HEIGHT)
+
+# Resolved once: collision traces are off by default, so skip the call entirely
+DEBUG_COLLISION_TRACE = DebugLogger.is_enabled("collision", "VERBOSE")
 
 
 class BaseEnemy(BaseEntity):
     """Base class providing shared logic for all enemy entities_animation."""
 
+    __slots__ = ("speed", "_base_image", "rotation_angle", "_last_vel")
+
+    # Contact damage dealt to the player (class-level default; bullets carry their own)
+    damage = 1
+
+    # Death animation, imported lazily on the first on_death() call
+    _death_fade = None
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -42,6 +59,7 @@ class BaseEnemy(BaseEntity):
 
         self._base_image = image
         self.rotation_angle = 0  # Degrees, 0 = pointing right
+        self._last_vel = (0.0, 0.0)  # Velocity used for the current rotation
 
         # Collision setup
         self.collision_tag = CollisionTags.ENEMY
@@ -69,28 +87,51 @@ class BaseEnemy(BaseEntity):
     # ===========================================================
     def update(self, dt: float):
         """Default downward movement for enemies."""
-        if self.death_state == LifecycleState.DYING:
+        if self.death_state == DYING:
             if self.anim.update(self, dt):
                 self.mark_dead(immediate=True)
             return
 
-        if self.death_state != LifecycleState.ALIVE:
+        if self.death_state != ALIVE:
             return
 
-        self.pos += self.velocity * dt
+        # In-place integration (no temporary Vector2 from velocity * dt)
+        pos = self.pos
+        vel = self.velocity
+        pos.update(pos.x + vel.x * dt, pos.y + vel.y * dt)
         self.sync_rect()
         self.update_rotation()
 
         # Mark dead if off-screen
-        if self.rect.top > Display.HEIGHT:
+        if self.rect.top > _DISPLAY_HEIGHT:
             self.mark_dead(immediate=True)
 
+    def reset(self, x, y, speed=None, health=None, **kwargs):
+        """
+        Reset enemy to reusable state (for pooling).
+
+        Args:
+            x, y: New spawn position.
+            speed (float, optional): New movement speed (keeps current if None).
+            health (int, optional): New HP (restores max_health if None).
+        """
+        super().reset(x, y, **kwargs)
+
+        if speed is not None:
+            self.speed = speed
+        self.health = health if health is not None else self.max_health
+        self.max_health = self.health
+
+        # Force rotation to be recomputed for the new velocity
+        self.rotation_angle = 0
+        self._last_vel = (0.0, 0.0)
+
     def take_damage(self, amount: int, source: str = "unknown"):
         """
         Reduce health by the given amount and handle death.
         Calls on_damage() and on_death() hooks as needed.
         """
-        if self.death_state >= LifecycleState.DEAD:
+        if self.death_state >= DEAD:
             return
 
         self.health = max(0, self.health - amount)
@@ -103,6 +144,10 @@ class BaseEnemy(BaseEntity):
             self.on_death(source)
 
     def on_death(self, source):
+        death_fade = BaseEnemy._death_fade
+        if death_fade is None:
+            from src.graphics.animations.animation_effects.death_animation import death_fade
+            BaseEnemy._death_fade = death_fade
         self.anim.play(death_fade, duration=0.5)
 
     # ===========================================================
@@ -110,14 +155,25 @@ class BaseEnemy(BaseEntity):
     # ===========================================================
     def draw(self, draw_manager):
         """Render the enemy sprite to the screen."""
-        draw_manager.draw_entity(self, layer=self.layer)
+        # Off-screen (e.g. still entering from above): nothing to blit
+        if not _VIEWPORT.colliderect(self.rect):
+            return
+        # Queue straight into the layer's blits() batch (image/rect always set)
+        draw_manager.queue_draw(self.image, self.rect, self.layer)
 
     def update_rotation(self):
         """
         Rotate image to match velocity direction.
         Only rotates if velocity changed (optimization).
         """
-        if self._base_image is None or self.velocity.length_squared() == 0:
+        # Straight-flying enemies keep the same velocity: skip the atan2 entirely
+        vx, vy = self.velocity
+        last_vx, last_vy = self._last_vel
+        if vx == last_vx and vy == last_vy:
+            return
+        self._last_vel = (vx, vy)
+
+        if self._base_image is None or (vx == 0 and vy == 0):
             return
 
         # Calculate angle from velocity (-90 because base triangle points up)
@@ -138,12 +194,12 @@ class BaseEnemy(BaseEntity):
         """Default collision response for enemies."""
         tag = getattr(other, "collision_tag", "unknown")
 
-        if tag == "player_bullet":
+        if tag == CollisionTags.PLAYER_BULLET:
             # DebugLogger.state(f"{type(self).__name__} hit by PlayerBullet")
             self.take_damage(1, source="player_bullet")
 
-        elif tag == "player":
+        elif tag == CollisionTags.PLAYER:
             self.take_damage(1, source="player_contact")
 
-        else:
+        elif DEBUG_COLLISION_TRACE:
             DebugLogger.trace(f"[CollisionIgnored] {type(self).__name__} vs {tag}")
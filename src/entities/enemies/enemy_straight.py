@@ -10,14 +10,39 @@ Responsibilities
 - Serve as a baseline template for other enemy types.
 """
 
-import pygame
+import math
 from src.entities.enemies.base_enemy import BaseEnemy
 from src.core.debug.debug_logger import DebugLogger
 
+# Pre-normalized 8-way directions (diagonals use 1/sqrt(2))
+_DIAG = math.sqrt(0.5)
+_DIR8 = {
+    (0, 1): (0.0, 1.0), (0, -1): (0.0, -1.0),
+    (1, 0): (1.0, 0.0), (-1, 0): (-1.0, 0.0),
+    (1, 1): (_DIAG, _DIAG), (-1, 1): (-_DIAG, _DIAG),
+    (1, -1): (_DIAG, -_DIAG), (-1, -1): (-_DIAG, -_DIAG),
+}
 
 class EnemyStraight(BaseEnemy):
     """Simple enemy that moves vertically downward and disappears when off-screen."""
 
+    __slots__ = ("_shape_key",)
+
+    # Normalized (dx, dy) per direction tuple; seeded with the 8-way table so
+    # the common directions never hit the sqrt/divide path
+    _DIR_CACHE = dict(_DIR8)
+
+    @classmethod
+    def _normalized(cls, direction):
+        """Return the unit vector for a direction tuple, memoized per direction."""
+        unit = cls._DIR_CACHE.get(direction)
+        if unit is None:
+            dx, dy = direction
+            length = math.hypot(dx, dy)
+            unit = (dx / length, dy / length) if length else (0.0, 0.0)
+            cls._DIR_CACHE[direction] = unit
+        return unit
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -42,8 +67,16 @@ class EnemyStraight(BaseEnemy):
         # Initialize base enemy
         super().__init__(x, y, triangle_image, speed, health)
 
-        # Set velocity from direction
-        self.velocity = pygame.Vector2(direction).normalize() * self.speed
+        # The triangle is shared through DrawManager's shape cache; death
+        # fades call set_alpha on self.image, so draw a private copy
+        self.image = self._base_image.copy()
+
+        # (size, color) of the current sprite, checked by reset()
+        self._shape_key = (size, color)
+
+        # Set velocity from direction (in place on the base class Vector2)
+        nx, ny = self._normalized(tuple(direction))
+        self.velocity.update(nx * self.speed, ny * self.speed)
 
         DebugLogger.init(
             f"Spawned EnemyStraight at ({x}, {y}) | Speed={speed}",
@@ -53,32 +86,25 @@ class EnemyStraight(BaseEnemy):
     # ===========================================================
     # Update Logic
     # ===========================================================
-    def update(self, dt: float):
-        """
-        Move the enemy downward each frame and mark as destroyed once off-screen.
-
-        Args:
-            dt (float): Delta time (in seconds) since last frame.
-        """
-        super().update(dt)
+    # Inherits BaseEnemy.update directly (no pass-through override): straight
+    # movement is exactly the base in-place integration, so each enemy's
+    # per-frame call skips an extra Python frame.
 
     def reset(self, x, y, direction=(0, 1), speed=200, health=1, size=50, color=(255, 0, 0), **kwargs):
         """Reset straight enemy with new parameters."""
-        super().reset(x, y, **kwargs)
+        super().reset(x, y, speed=speed, health=health, **kwargs)
 
-        # Regenerate sprite if size/color changed (optional optimization: only if different)
-        if self.draw_manager:
+        # Only fetch a new sprite if size/color changed; the base image stays
+        # shared, but the drawn image is copied since fades mutate its alpha
+        shape_key = (size, color)
+        if self.draw_manager and shape_key != self._shape_key:
             self._base_image = self.draw_manager.create_triangle(size, color, pointing="up")
-            self.image = self._base_image.copy()
+            self._shape_key = shape_key
+        self.image = self._base_image.copy()
 
         # Reset physics
-        self.speed = speed
-        self.health = health
-        self.max_health = health
-        self.velocity = pygame.Vector2(direction).normalize() * speed
-
-        # Reset rotation state
-        self.rotation_angle = 0
+        nx, ny = self._normalized(tuple(direction))
+        self.velocity.update(nx * speed, ny * speed)
 
         # Force immediate rotation update to match velocity
         self.update_rotation()
@@ -5,18 +5,19 @@ Central registry and factory for dynamic entity creation.
 
 Responsibilities
 ----------------
-- Maintain a global mapping of entity classes by category and type name.
+- Maintain a global mapping of entity classes keyed by (category, type name).
 - Allow other modules to register entities_animation automatically on import.
 - Provide a safe unified `create()` factory for all entity spawning.
 """
 
+import sys
 from src.core.debug.debug_logger import DebugLogger
 
 
 class EntityRegistry:
     """Global registry and factory for creating entities_animation dynamically."""
 
-    _registry = {}  # {category: {type_name: class}}
+    _registry = {}  # {(category, type_name): class}
 
     # ===========================================================
     # Registration
@@ -24,15 +25,14 @@ class EntityRegistry:
     @classmethod
     def register(cls, category: str, name: str, entity_class):
         """Register an entity class under a specific category."""
-        if category not in cls._registry:
-            cls._registry[category] = {}
-        cls._registry[category][name] = entity_class
+        # Flat tuple key with interned strings → single hash probe on lookup
+        cls._registry[(sys.intern(category), sys.intern(name))] = entity_class
         DebugLogger.state(f"[Registry] Registered entity [{category}:{name}]", category="loading")
 
     @classmethod
     def get(cls, category: str, name: str):
         """Retrieve an entity class by category and name."""
-        return cls._registry.get(category, {}).get(name, None)
+        return cls._registry.get((category, name))
 
     # ===========================================================
     # Factory
@@ -4,6 +4,8 @@ entity_state.py
 Defines universal constants and enumerations for all entity types.
 """
 
+import sys
+from collections import namedtuple
 from enum import IntEnum
 
 class EntityCategory:
@@ -37,6 +39,25 @@ class CollisionTags:
     PICKUP = "pickup"
     HAZARD = "hazard"
 
+    @staticmethod
+    def bullet(owner: str) -> str:
+        """
+        Return the bullet tag for an owner ("player" → PLAYER_BULLET).
+
+        Always hands back the shared interned string, so tag equality checks
+        in collision handlers resolve on identity instead of comparing chars.
+        """
+        tag = _BULLET_TAGS.get(owner)
+        if tag is None:
+            tag = _BULLET_TAGS[owner] = sys.intern(f"{owner}_bullet")
+        return tag
+
+
+_BULLET_TAGS = {
+    "player": CollisionTags.PLAYER_BULLET,
+    "enemy": CollisionTags.ENEMY_BULLET,
+}
+
 class LifecycleState(IntEnum):
     """
     Tracks the life/death progression of an entity.
@@ -45,3 +66,41 @@ class LifecycleState(IntEnum):
     ALIVE = 0
     DYING = 1      # Playing death animation/effect
     DEAD = 2       # Ready for cleanup
+
+
+# ===========================================================
+# Lifecycle Fast-Path Constants
+# ===========================================================
+# Plain ints mirroring LifecycleState. Entities store death_state as one of
+# these so per-frame checks are raw int compares (no enum attribute lookup).
+ALIVE = 0
+DYING = 1
+DEAD = 2
+
+# Index → name table for logging (death_state.name is unavailable on ints)
+LIFECYCLE_NAMES = ("ALIVE", "DYING", "DEAD")
+
+
+# ===========================================================
+# Shape Rendering Data
+# ===========================================================
+class ShapeData(namedtuple("ShapeData", "type color size kwargs")):
+    """
+    Immutable shape definition used by shape-rendered entities.
+
+    Built once at entity init from the shape_data dict so per-frame
+    draw paths use tuple attribute access instead of dict lookups.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Freeze a shape_data dict (or pass through an existing ShapeData / None)."""
+        if data is None or isinstance(data, cls):
+            return data
+        return cls(
+            data["type"],
+            tuple(data["color"]),
+            tuple(data.get("size", (10, 10))),
+            data.get("kwargs") or {},
+        )
@@ -15,12 +15,17 @@ import pygame
 from src.core.runtime.game_settings import Display, Layers
 from src.core.debug.debug_logger import DebugLogger
 from src.entities.base_entity import BaseEntity
-from src.entities.entity_state import CollisionTags, LifecycleState, EntityCategory
+from src.entities.entity_state import CollisionTags, EntityCategory, ALIVE
+
+# Screen bounds used to skip queuing sprites that would not be visible
+_VIEWPORT = pygame.Rect(0, 0, Display.WIDTH, Display.HEIGHT)
 
 
 class BaseItem(BaseEntity):
     """Base class for all collectible items."""
 
+    __slots__ = ("speed", "despawn_y")
+
     def __init__(self, x, y, image=None, shape_data=None, draw_manager=None,
                  speed=50, despawn_y=None):
         """
@@ -53,26 +58,49 @@ class BaseItem(BaseEntity):
 
     def update(self, dt: float):
         """Update item position and check for despawn."""
-        if self.death_state != LifecycleState.ALIVE:
+        if self.death_state != ALIVE:
             return
 
-        # Move downward
-        self.pos += self.velocity * dt
-        self.sync_rect()
+        # Move downward (in place, no temporary Vector2 from velocity * dt)
+        pos = self.pos
+        vel = self.velocity
+        pos.update(pos.x + vel.x * dt, pos.y + vel.y * dt)
+        rect = self.rect
+        rect.center = pos
 
         # Despawn if off-screen
-        if self.rect.top > self.despawn_y:
+        if rect.top > self.despawn_y:
             self.mark_dead(immediate=True)
 
+    def reset(self, x, y, speed=None, despawn_y=None, **kwargs):
+        """
+        Reset item to reusable state (for pooling).
+
+        Args:
+            x, y: New spawn position.
+            speed (float, optional): New fall speed (keeps current if None).
+            despawn_y (float, optional): New despawn line (keeps current if None).
+        """
+        super().reset(x, y, **kwargs)
+
+        if speed is not None:
+            self.speed = speed
+        if despawn_y is not None:
+            self.despawn_y = despawn_y
+        self.velocity.update(0, self.speed)
+
     def draw(self, draw_manager):
         """Render the item sprite."""
-        draw_manager.draw_entity(self, layer=self.layer)
+        if not _VIEWPORT.colliderect(self.rect):
+            return
+        # Queue straight into the layer's blits() batch (image/rect always set)
+        draw_manager.queue_draw(self.image, self.rect, self.layer)
 
     def on_collision(self, other):
         """Handle collision with player."""
         tag = getattr(other, "collision_tag", "unknown")
 
-        if tag == "player":
+        if tag == CollisionTags.PLAYER:
             self.on_pickup(other)
             self.mark_dead(immediate=True)
 
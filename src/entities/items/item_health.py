@@ -10,6 +10,8 @@ from .base_item import BaseItem
 class HealthPickup(BaseItem):
     """Small health restore item."""
 
+    __slots__ = ("heal_amount",)
+
     def __init__(self, x, y, draw_manager=None):
         """
         Initialize health pickup.
@@ -42,4 +44,8 @@ class HealthPickup(BaseItem):
 
         # Example health restoration (requires player health system)
         # if hasattr(player, 'health') and hasattr(player, 'max_health'):
-        #     player.health = min(player.health + self.heal_amount, player.max_health)
\ No newline at end of file
+        #     player.health = min(player.health + self.heal_amount, player.max_health)
+
+
+from src.entities.entity_registry import EntityRegistry
+EntityRegistry.register("item", "health", HealthPickup)
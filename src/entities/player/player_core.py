@@ -15,22 +15,59 @@ Responsibilities
 
 import pygame
 import os
+from collections import namedtuple
 
 from src.core.runtime.game_settings import Display, Layers
 from src.core.runtime.game_state import STATE
 from src.core.debug.debug_logger import DebugLogger
 from src.core.services.config_manager import load_config
+from src.graphics import image_cache
 
 from src.entities.base_entity import BaseEntity
 from src.entities.status_manager import StatusManager
-from src.entities.entity_state import CollisionTags, LifecycleState, EntityCategory
+from src.entities.entity_state import CollisionTags, EntityCategory, ShapeData, ALIVE, DYING
 
 from .player_state import InteractionState
+from .player_movement import update_movement
+from .player_ability import update_shooting
+from .player_logic import damage_collision
+
+
+# ===========================================================
+# Player Configuration
+# ===========================================================
+# Frozen view of "core_attributes": per-frame reads are tuple field loads
+PlayerCoreConfig = namedtuple(
+    "PlayerCoreConfig",
+    "scale health hitbox_scale speed accel_rate friction_rate max_speed_mult"
+)
+
+_PLAYER_CONFIG = None
+
+
+def get_player_config():
+    """
+    Return the parsed player_config.json, loading it on first use only.
+
+    Respawns and additional Player instances reuse the cached dict instead of
+    hitting disk and re-parsing JSON. Treat the result as read-only.
+    """
+    global _PLAYER_CONFIG
+    if _PLAYER_CONFIG is None:
+        _PLAYER_CONFIG = load_config("player_config.json", {})
+    return _PLAYER_CONFIG
 
 
 class Player(BaseEntity):
     """Represents the controllable player entity."""
 
+    __slots__ = (
+        "cfg", "core", "render_mode", "speed", "state", "move_vec",
+        "health_thresholds", "_threshold_values", "_threshold_states",
+        "input_manager", "bullet_manager", "shoot_cooldown", "shoot_timer",
+        "status_manager", "_half_w", "_half_h", "_max_x", "_max_y",
+    )
+
     def __init__(self, x: float | None = None, y: float | None = None,
                  image: pygame.Surface | None = None, draw_manager=None,
                  input_manager=None):
@@ -39,10 +76,12 @@ class Player(BaseEntity):
         # ========================================
         # 1. Load Config
         # ========================================
-        cfg = load_config("player_config.json", {})
+        cfg = get_player_config()
         self.cfg = cfg
 
-        core = cfg["core_attributes"]
+        core_cfg = cfg["core_attributes"]
+        core = PlayerCoreConfig._make(core_cfg[f] for f in PlayerCoreConfig._fields)
+        self.core = core
         render = cfg["render"]
         health_cfg = cfg["health_states"]
 
@@ -54,8 +93,7 @@ class Player(BaseEntity):
         default_state = render["default_shape"]
 
         if self.render_mode == "image":
-            image = self._load_sprite(render, image)
-            image = self._apply_scaling(size, image)
+            image = self._load_sprite(render, image, size)
             shape_data = None
         else:
             image = None
@@ -75,14 +113,21 @@ class Player(BaseEntity):
         super().__init__(x, y, image=image, shape_data=shape_data, draw_manager=draw_manager)
 
         if self.render_mode == "shape":
-            self.shape_data = shape_data
+            self.shape_data = ShapeData.from_dict(shape_data)
 
         # ========================================
         # 4. Core Stats
         # ========================================
         self.velocity = pygame.Vector2(0, 0)
-        self.speed = core["speed"]
-        self.health = core["health"]
+
+        # Screen clamp bounds (player rect size is fixed after sprite load)
+        self._half_w = self.rect.width * 0.5
+        self._half_h = self.rect.height * 0.5
+        self._max_x = Display.WIDTH - self._half_w
+        self._max_y = Display.HEIGHT - self._half_h
+        self.move_vec = pygame.Vector2(0, 0)  # Overwritten by GameScene input each frame
+        self.speed = core.speed
+        self.health = core.health
         self.max_health = self.health
         self._cached_health = self.health
 
@@ -96,14 +141,18 @@ class Player(BaseEntity):
         # 5. Visual State System
         # ========================================
         self.health_thresholds = health_cfg["thresholds"]
-        self._threshold_moderate = self.health_thresholds["moderate"]
-        self._threshold_critical = self.health_thresholds["critical"]
 
-        # Load images if needed
+        # Tiers sorted by threshold for bisect lookup: health <= value → state
+        tiers = sorted(self.health_thresholds.items(), key=lambda kv: kv[1])
+        self._threshold_values = [value for _, value in tiers]
+        self._threshold_states = [f"damaged_{name}" for name, _ in tiers] + ["normal"]
+
+        # Image states are deferred: store (path, size) and load each one the
+        # first time get_target_image() asks for it (see override below)
         images = None
         if self.render_mode == "image":
             images = {
-                state_key: self._load_and_scale(path, size)
+                state_key: (path, size)
                 for state_key, path in health_cfg["image_states"].items()
             }
 
@@ -119,7 +168,7 @@ class Player(BaseEntity):
         # ========================================
         # 6. Collision & Combat
         # ========================================
-        self.hitbox_scale = core["hitbox_scale"]
+        self.hitbox_scale = core.hitbox_scale
 
         if input_manager is not None:
             self.input_manager = input_manager
@@ -141,10 +190,10 @@ class Player(BaseEntity):
     # Helper Methods
     # ===========================================================
     @staticmethod
-    def _load_sprite(render_cfg, image):
-        """Load player sprite from disk or fallback."""
+    def _load_sprite(render_cfg, image, size):
+        """Load player sprite (scaled to size) from disk or fallback."""
         if image:
-            return image
+            return Player._apply_scaling(size, image)
 
         sprite_path = render_cfg.get("sprite", {}).get("path")
 
@@ -152,16 +201,16 @@ class Player(BaseEntity):
             DebugLogger.warn(f"Missing sprite: {sprite_path}, using fallback.")
             placeholder = pygame.Surface((64, 64))
             placeholder.fill((255, 50, 50))
-            return placeholder
+            return Player._apply_scaling(size, placeholder)
 
-        image = pygame.image.load(sprite_path).convert_alpha()
+        image = Player._load_and_scale(sprite_path, size)
         DebugLogger.state(f"Loaded sprite from {sprite_path}")
         return image
 
     @staticmethod
     def _apply_scaling(size, image):
         """Scale sprite to configured size."""
-        if not image:
+        if not image or image.get_size() == size:
             return image
         return pygame.transform.scale(image, size)
 
@@ -183,9 +232,34 @@ class Player(BaseEntity):
 
     @staticmethod
     def _load_and_scale(path, size):
-        """Load and scale a single image state."""
-        img = pygame.image.load(path).convert_alpha()
-        return pygame.transform.scale(img, size)
+        """Load and scale a single image state (cached per path and size).
+
+        The cached surface is shared process-wide, and the death fade and
+        i-frame blink call set_alpha on the player's image, so the player
+        gets its own copy.
+        """
+        return image_cache.load_scaled(path, size).copy()
+
+    # ===========================================================
+    # Visual States (lazy image loading)
+    # ===========================================================
+    def get_target_image(self, state_key):
+        """Get image for target visual state, loading it on first use."""
+        images = self._visual_state_config.get("images", {})
+        image = images.get(state_key)
+        if type(image) is tuple:
+            path, size = image
+            if os.path.exists(path):
+                image = self._load_and_scale(path, size)
+            else:
+                DebugLogger.warn(f"Missing state image: {path}, keeping current sprite.")
+                image = None
+            images[state_key] = image
+        return image
+
+    def get_current_image(self):
+        """Get image for current visual state, loading it on first use."""
+        return self.get_target_image(self._current_visual_state)
 
     # ===========================================================
     # Frame Cycle
@@ -193,7 +267,7 @@ class Player(BaseEntity):
     def update(self, dt):
         """Update player components."""
 
-        if self.death_state == LifecycleState.DYING:
+        if self.death_state == DYING:
             # Update animation; returns True when finished
             if self.anim.update(self, dt):
                 # Finalize death
@@ -201,23 +275,23 @@ class Player(BaseEntity):
                 DebugLogger.state("Player death animation complete", category="player")
             return
 
-        if self.death_state != LifecycleState.ALIVE:
+        if self.death_state != ALIVE:
             return
 
         self.anim.update(self, dt)
 
         # 1. Time-based status_effects and temporary states
-        self.status_manager.update(dt)
-        # 2. Input collection
-        self.input_manager.update()
+        #    (guarded here: no call at all on the common no-effect frame)
+        status_manager = self.status_manager
+        if status_manager.active_effects:
+            status_manager.update(dt)
+        # 2. Input is polled once per step by the game loop before
+        #    scenes update; move_vec is already set by GameScene
 
         # 3. Movement and physics
-        from .player_movement import update_movement
-        move_vec = getattr(self, "move_vec", pygame.Vector2(0, 0))
-        update_movement(self, dt, move_vec)
+        update_movement(self, dt, self.move_vec)
 
         # 4. Combat logic
-        from .player_ability import update_shooting
         attack_held = self.input_manager.is_attack_held()
         update_shooting(self, dt, attack_held)
 
@@ -240,5 +314,4 @@ class Player(BaseEntity):
 
         # damaging collisions
         if tag in (CollisionTags.ENEMY, CollisionTags.ENEMY_BULLET):
-            from .player_logic import damage_collision
             damage_collision(self, other)
@@ -7,11 +7,21 @@ These functions are called by entity_logic.py or directly by player systems.
 They handle player-exclusive logic like i-frames, death cleanup, and visuals.
 """
 
+from bisect import bisect_left
+
 from src.core.debug.debug_logger import DebugLogger
-from src.entities.entity_state import LifecycleState
+from src.entities.entity_state import CollisionTags, ALIVE
 from src.entities.player.player_state import PlayerEffectState, InteractionState
 from src.graphics.animations.entities_animation.player_animation import damage_player, death_player
 
+# Resolved once: the damage path skips building log strings for filtered categories
+DEBUG_COLLISION_TRACE = DebugLogger.is_enabled("collision", "VERBOSE")
+DEBUG_COLLISION = DebugLogger.is_enabled("collision")
+DEBUG_ANIMATION = DebugLogger.is_enabled("animation")
+
+# Bound once: the state gate is a global load instead of a class attribute chain
+_DEFAULT_STATE = InteractionState.DEFAULT
+
 
 # ===========================================================
 # Entity Hook: Damage Response
@@ -26,51 +36,51 @@ def damage_collision(player, other):
         - Retrieve damage value from collided entity
         - Apply damage and trigger IFRAME via EffectManager
     """
-    if player.death_state != LifecycleState.ALIVE:
-        DebugLogger.trace("Player already dead", category="collision")
+    if player.death_state != ALIVE:
+        if DEBUG_COLLISION_TRACE:
+            DebugLogger.trace("Player already dead", category="collision")
         return
 
     # Skip collisions if player is in non-default state
-    if player.state is not InteractionState.DEFAULT:
-        DebugLogger.trace(f"PlayerState = {player.state.name}", category="collision")
+    if player.state is not _DEFAULT_STATE:
+        if DEBUG_COLLISION_TRACE:
+            DebugLogger.trace(f"PlayerState = {player.state.name}", category="collision")
         return
 
-    # Determine damage value from the other entity
-    damage = getattr(other, "damage", 1)
+    # Damage value from the other entity (enemies and bullets always define it)
+    damage = other.damage
     if damage <= 0:
-        DebugLogger.trace(f"Invalid damage value {damage}", category="collision")
+        if DEBUG_COLLISION_TRACE:
+            DebugLogger.trace(f"Invalid damage value {damage}", category="collision")
         return
 
     # Apply damage
     prev_health = player.health
     player.health -= damage
-    DebugLogger.action(
-        f"Player took {damage} damage ({prev_health} → {player.health})",
-        category="collision"
-    )
+    if DEBUG_COLLISION:
+        DebugLogger.action(
+            f"Player took {damage} damage ({prev_health} → {player.health})",
+            category="collision"
+        )
 
     # Handle player death
     if player.health <= 0:
-        print("ded")
         on_death(player)
         return
-    print("not ded")
 
-    # Determine target visual state
-    if player.health <= player._threshold_critical:
-        target_state = "damaged_critical"
-    elif player.health <= player._threshold_moderate:
-        target_state = "damaged_moderate"
-    else:
-        target_state = "normal"
+    # Determine target visual state (first tier whose threshold >= health)
+    target_state = player._threshold_states[
+        bisect_left(player._threshold_values, player.health)
+    ]
 
     iframe_time = player.status_manager.effect_config["iframe"]["duration"]
     previous_state = player._current_visual_state  # Get OLD state before damage
 
-    DebugLogger.state(
-        f"Visual transition: {previous_state} → {target_state}",
-        category="animation"
-    )
+    if DEBUG_ANIMATION:
+        DebugLogger.state(
+            f"Visual transition: {previous_state} → {target_state}",
+            category="animation"
+        )
 
     player.anim.play(
         damage_player,
@@ -102,7 +112,7 @@ def on_death(player):
     player.mark_dead()
 
     # Disable collisions during death animation
-    player.collision_tag = "neutral"
+    player.collision_tag = CollisionTags.NEUTRAL
 
 
 # ===========================================================
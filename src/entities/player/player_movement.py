@@ -10,8 +10,7 @@ Responsibilities
 - Clamp player position and velocity to the visible screen area.
 """
 
-import pygame
-from src.core.runtime.game_settings import Display
+import math
 
 
 def update_movement(player, dt, move_vec):
@@ -27,78 +26,99 @@ def update_movement(player, dt, move_vec):
     # -------------------------------------------------------
     # Retrieve movement parameters from config
     # -------------------------------------------------------
-    core = player.cfg["core_attributes"]
-    accel_rate = core["accel_rate"]
-    friction_rate = core["friction_rate"]
-    max_speed_mult = core["max_speed_mult"]
+    core = player.core
+    accel_rate = core.accel_rate
+    friction_rate = core.friction_rate
+    max_speed_mult = core.max_speed_mult
+
+    # -------------------------------------------------------
+    # Integrate velocity and position on scalar floats
+    # -------------------------------------------------------
+    pos = player.pos
+    vel = player.velocity
+    mx, my = move_vec
+
+    px, py, vx, vy = _integrate_motion(
+        pos.x, pos.y, vel.x, vel.y, mx, my, dt,
+        player.speed, accel_rate, friction_rate, player.speed * max_speed_mult
+    )
+
+    # -------------------------------------------------------
+    # Constrain within screen bounds (inlined clamp on the
+    # bounds cached at init), then write back once
+    # -------------------------------------------------------
+    half_w = player._half_w
+    half_h = player._half_h
+    if px < half_w:
+        px, vx = half_w, 0.0
+    elif px > player._max_x:
+        px, vx = player._max_x, 0.0
+
+    if py < half_h:
+        py, vy = half_h, 0.0
+    elif py > player._max_y:
+        py, vy = player._max_y, 0.0
+
+    vel.update(vx, vy)
+    pos.update(px, py)
+
+    # Sync render rectangle to updated position
+    player.sync_rect()
+
+
+def _integrate_motion(px, py, vx, vy, mx, my, dt,
+                      speed, accel_rate, friction_rate, max_speed):
+    """
+    Advance player velocity and position using plain float math.
+
+    Pure scalar kernel (no Vector2 temporaries): lerp toward the desired
+    velocity, accelerate, cap to max_speed, or apply friction when idle.
+
+    Returns:
+        tuple[float, float, float, float]: New (px, py, vx, vy).
+    """
+    move_len_sq = mx * mx + my * my
 
     # -------------------------------------------------------
     # Movement input active
     # -------------------------------------------------------
-    move_len_sq = move_vec.length_squared()
     if move_len_sq > 0:
-        # Normalize input and compute target velocity
-        move_vec = move_vec.normalize()
-        desired_velocity = move_vec * player.speed
+        # Normalize input direction
+        inv_len = 1.0 / math.sqrt(move_len_sq)
+        mx *= inv_len
+        my *= inv_len
 
-        # Smoothly interpolate toward desired velocity
-        player.velocity = player.velocity.lerp(desired_velocity, 0.25)
+        # Smoothly interpolate toward desired velocity (lerp factor 0.25)
+        vx += (mx * speed - vx) * 0.25
+        vy += (my * speed - vy) * 0.25
 
         # Apply acceleration to build up momentum
-        player.velocity += move_vec * accel_rate * dt
+        vx += mx * accel_rate * dt
+        vy += my * accel_rate * dt
 
         # Limit top speed
-        vel_len_sq = player.velocity.length_squared()
-        max_speed = player.speed * max_speed_mult
-        max_speed_sq = max_speed ** 2
-        if vel_len_sq > max_speed_sq:
-            player.velocity.scale_to_length(max_speed)
+        vel_len_sq = vx * vx + vy * vy
+        if vel_len_sq > max_speed * max_speed:
+            scale = max_speed / math.sqrt(vel_len_sq)
+            vx *= scale
+            vy *= scale
 
     # -------------------------------------------------------
     # No movement input — apply friction
     # -------------------------------------------------------
-    else:
-        current_speed = player.velocity.length()
+    elif vx or vy:
+        # (Skipped entirely while standing still: no sqrt on idle frames)
+        current_speed = math.sqrt(vx * vx + vy * vy)
         if current_speed > 0:
             new_speed = max(0.0, current_speed - friction_rate * dt)
 
             # Stop completely when almost stationary
             if new_speed < 5.0:
-                player.velocity.xy = (0, 0)
+                vx = vy = 0.0
             else:
-                player.velocity.scale_to_length(new_speed)
-
-    # -------------------------------------------------------
-    # Update position and constrain within screen bounds
-    # -------------------------------------------------------
-    player.pos += player.velocity * dt
-    clamp_to_screen(player)
+                scale = new_speed / current_speed
+                vx *= scale
+                vy *= scale
 
-    # Sync render rectangle to updated position
-    player.sync_rect()
+    return px + vx * dt, py + vy * dt, vx, vy
 
-
-def clamp_to_screen(player):
-    """
-    Prevent the player from leaving the visible screen area.
-    If the player hits the border, their velocity on that axis is reset to zero.
-
-    Args:
-        player (Player): The player instance to clamp.
-    """
-    screen_w, screen_h = Display.WIDTH, Display.HEIGHT
-    half_w = player.rect.width * 0.5
-    half_h = player.rect.height * 0.5
-
-    # Store old position BEFORE clamping
-    old_x, old_y = player.pos.x, player.pos.y
-
-    # Clamp position
-    player.pos.x = max(half_w, min(player.pos.x, screen_w - half_w))
-    player.pos.y = max(half_h, min(player.pos.y, screen_h - half_h))
-
-    # Stop velocity if clamping occurred
-    if player.pos.x != old_x:
-        player.velocity.x = 0
-    if player.pos.y != old_y:
-        player.velocity.y = 0
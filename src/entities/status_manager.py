@@ -14,10 +14,15 @@ Responsibilities
 from src.core.debug.debug_logger import DebugLogger
 from src.entities.player.player_state import InteractionState, PlayerEffectState
 
+# Resolved once so effect ticks skip building log strings when "system" is off
+DEBUG_STATUS = DebugLogger.is_enabled("system")
+
 
 class StatusManager:
     """Manages temporary status animation_effects on any entity."""
 
+    __slots__ = ("entity", "effect_config", "_timers", "active_effects", "_resolved_states")
+
     def __init__(self, entity, config):
         """
         Args:
@@ -26,7 +31,21 @@ class StatusManager:
         """
         self.entity = entity
         self.effect_config = config
-        self.active_effects = {}  # {PlayerEffectState: remaining_time}
+
+        # Fixed-size timer table indexed by effect value (no dict hashing),
+        # plus the short list of effects currently running
+        self._timers = [0.0] * len(PlayerEffectState)  # remaining seconds
+        # [PlayerEffectState, ...] in activation order. Read-only for callers:
+        # owners check its truthiness to skip update() while nothing runs.
+        self.active_effects = []
+
+        # Interaction state per effect, resolved from the config strings once
+        self._resolved_states = [
+            getattr(InteractionState,
+                    config.get(effect.name.lower(), {}).get("interaction_state", "DEFAULT"),
+                    InteractionState.DEFAULT)
+            for effect in PlayerEffectState
+        ]
 
     def activate(self, effect: PlayerEffectState) -> bool:
         """
@@ -48,12 +67,14 @@ class StatusManager:
 
         cfg = self.effect_config[effect_name]
         duration = cfg.get("duration", 0.0)
-        self.active_effects[effect] = duration
 
         # Add or refresh timer
-        self.active_effects[effect] = duration
+        if effect not in self.active_effects:
+            self.active_effects.append(effect)
+        self._timers[effect] = duration
 
-        DebugLogger.action(f"{effect.name}: Duration: {duration:.2f}s")
+        if DEBUG_STATUS:
+            DebugLogger.action(f"{effect.name}: Duration: {duration:.2f}s")
 
         # Update entity interaction state
         self._update_entity_state()
@@ -67,31 +88,33 @@ class StatusManager:
         Args:
             dt: Delta time in seconds
         """
-        if not self.active_effects:
+        active = self.active_effects
+        if not active:
             return
 
-        # Decrement timers
-        expired = []
-        for effect, time_remaining in self.active_effects.items():
-            new_time = time_remaining - dt
+        # Decrement timers in place; keep only effects with time left
+        timers = self._timers
+        still_active = []
+        for effect in active:
+            new_time = timers[effect] - dt
             if new_time <= 0:
-                expired.append(effect)
+                timers[effect] = 0.0
+                if DEBUG_STATUS:
+                    DebugLogger.state(f"{effect.name} expired")
             else:
-                self.active_effects[effect] = new_time
-
-        # Remove expired
-        for effect in expired:
-            del self.active_effects[effect]
-            DebugLogger.state(f"{effect.name} expired")
+                timers[effect] = new_time
+                still_active.append(effect)
 
         # Recalculate state if anything changed
-        if expired:
+        if len(still_active) != len(active):
+            self.active_effects = still_active
             self._update_entity_state()
 
     def remove(self, effect: PlayerEffectState):
         """Manually remove an effect."""
         if effect in self.active_effects:
-            del self.active_effects[effect]
+            self.active_effects.remove(effect)
+            self._timers[effect] = 0.0
             self._update_entity_state()
 
     def is_active(self, effect: PlayerEffectState) -> bool:
@@ -100,18 +123,18 @@ class StatusManager:
 
     def has_any_effect(self) -> bool:
         """Check if any effect is active."""
-        return len(self.active_effects) > 0
+        return bool(self.active_effects)
 
     def get_active_effects(self) -> list:
         """Get list of currently active animation_effects."""
-        return list(self.active_effects.keys())
+        return list(self.active_effects)
 
     def _update_entity_state(self):
         """Recalculate entity interaction state from active animation_effects."""
         old_state = getattr(self.entity, "state", InteractionState.DEFAULT)
 
         if not self.active_effects:
-            if old_state != InteractionState.DEFAULT:
+            if DEBUG_STATUS and old_state != InteractionState.DEFAULT:
                 DebugLogger.state(
                     f"{self.entity.__class__.__name__} interaction mode: "
                     f"{old_state.name} → DEFAULT"
@@ -119,25 +142,16 @@ class StatusManager:
             self.entity.state = InteractionState.DEFAULT
             return
 
-        if not self.active_effects:
-            self.entity.state = InteractionState.DEFAULT
-            return
-
         # Find highest interaction state from all active animation_effects
         max_state = InteractionState.DEFAULT
+        resolved = self._resolved_states
 
-        for effect in self.active_effects.keys():
-            effect_name = effect.name.lower()
-            cfg = self.effect_config.get(effect_name, {})
-            state_str = cfg.get("interaction_state", "DEFAULT")
-
-            # Convert string to enum
-            state = getattr(InteractionState, state_str, InteractionState.DEFAULT)
-
+        for effect in self.active_effects:
+            state = resolved[effect]
             if state > max_state:
                 max_state = state
 
-        if max_state != old_state:
+        if DEBUG_STATUS and max_state != old_state:
             DebugLogger.state(
                 f"{self.entity.__class__.__name__} interaction changed: "
                 f"{old_state.name} → {max_state.name}"
@@ -13,6 +13,7 @@ class AnimationController:
         self.active_func = anim_func
         self.timer = 0.0
         self.duration = duration
+        self.entity = None  # New context: re-expose it on the next update()
         self.context = {
             "duration": duration,
             "elapsed_time": 0.0,
@@ -23,22 +24,29 @@ class AnimationController:
         if not self.active_func:
             return False
 
-        self.timer += dt
-        t = min(1.0, self.timer / self.duration)
+        timer = self.timer + dt
+        self.timer = timer
+        t = timer / self.duration
+        if t > 1.0:
+            t = 1.0
 
         # Update elapsed time in context
-        self.context["elapsed_time"] = self.timer
+        context = self.context
+        context["elapsed_time"] = timer
 
-        # Make context accessible to entity
-        entity.anim_context = self.context
+        # Make context accessible to entity (once per play(), not per frame)
+        if self.entity is not entity:
+            entity.anim_context = context
+            self.entity = entity
 
         self.active_func(entity, t)
 
         if t >= 1.0:
             self.active_func = None
 
-            if "target_state" in self.context:
-                _apply_visual_state(entity, self.context["target_state"])
+            target_state = context.get("target_state")
+            if target_state is not None:
+                _apply_visual_state(entity, target_state)
 
             return True
         return False
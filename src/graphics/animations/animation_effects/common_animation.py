@@ -1,6 +1,10 @@
 """Common reusable animation effects."""
 import pygame
 
+# Discrete steps for transform-based effects: the surface is only rebuilt
+# when the step changes, not on every frame of the animation
+SCALE_STEPS = 16
+
 
 def fade_out(entity, t):
     """Fade entity from opaque to transparent."""
@@ -14,15 +18,33 @@ def fade_in(entity, t):
     entity.image.set_alpha(alpha)
 
 
+def enter_step(entity, t, steps, key):
+    """
+    Quantize t into one of `steps` buckets.
+
+    Returns the bucket index, or None if the entity is already showing it
+    (tracked in the animation context, which is fresh for every play()).
+    """
+    step = min(steps - 1, int(t * steps))
+    ctx = getattr(entity, "anim_context", None)
+    if ctx is not None:
+        if ctx.get(key) == step:
+            return None
+        ctx[key] = step
+    return step
+
+
 def scale_down(entity, t):
     """Shrink entity to 0."""
     if not hasattr(entity, '_original_image'):
         entity._original_image = entity.image.copy()
 
-    scale = 1.0 - t
-    if scale <= 0:
+    step = enter_step(entity, t, SCALE_STEPS, "_scale_step")
+    if step is None:
         return
 
+    scale = 1.0 - step / SCALE_STEPS
+
     new_size = (
         max(1, int(entity._original_image.get_width() * scale)),
         max(1, int(entity._original_image.get_height() * scale))
@@ -62,6 +84,12 @@ def fade_color(entity, t, start_color=(255, 0, 0), end_color=(0, 0, 0)):
     if not hasattr(entity, '_original_image'):
         entity._original_image = entity.image.copy()
 
+    # Only rebuild the tinted copy when the flash moves to a new step
+    step = enter_step(entity, t, SCALE_STEPS, "_flash_step")
+    if step is None:
+        return
+    t = step / (SCALE_STEPS - 1)
+
     # Lerp flash intensity
     r = int(start_color[0] + (end_color[0] - start_color[0]) * t)
     g = int(start_color[1] + (end_color[1] - start_color[1]) * t)
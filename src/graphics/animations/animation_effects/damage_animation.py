@@ -1,6 +1,6 @@
 """Damage/hit reaction effects."""
 import pygame
-from .common_animation import (blink)
+from .common_animation import (blink, SCALE_STEPS, enter_step)
 
 
 def damage_blink(entity, t):
@@ -13,8 +13,13 @@ def damage_flash(entity, t):
     if not hasattr(entity, '_original_image'):
         entity._original_image = entity.image.copy()
 
+    # Only rebuild the tinted copy when the flash moves to a new step
+    step = enter_step(entity, t, SCALE_STEPS, "_flash_step")
+    if step is None:
+        return
+
     # Red overlay intensity decreases over time
-    intensity = int(255 * (1.0 - t))
+    intensity = int(255 * (1.0 - step / (SCALE_STEPS - 1)))
     flash_surf = entity._original_image.copy()
     flash_surf.fill((intensity, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
     entity.image = flash_surf
\ No newline at end of file
@@ -1,6 +1,9 @@
 """Death animation variants."""
 import pygame
-from .common_animation import fade_out, scale_down
+from .common_animation import fade_out, scale_down, enter_step
+
+# 10° increments: the rotation only changes 36 times per full spin
+ROTATE_STEPS = 36
 
 
 def death_fade(entity, t):
@@ -21,6 +24,10 @@ def death_spin_fade(entity, t):
     if not hasattr(entity, '_original_image'):
         entity._original_image = entity.image.copy()
 
-    angle = t * 360
+    step = enter_step(entity, t, ROTATE_STEPS, "_rotate_step")
+    if step is None:
+        return
+
+    angle = step * (360 / ROTATE_STEPS)
     entity.image = pygame.transform.rotate(entity._original_image, angle)
     entity.rect = entity.image.get_rect(center=entity.rect.center)
\ No newline at end of file
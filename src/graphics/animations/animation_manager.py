@@ -12,13 +12,49 @@ Responsibilities
 - Support in-animation effect triggers (e.g., particles, sounds, flashes).
 """
 
+from heapq import heappush, heappop
+from itertools import count
+
 from src.core.debug.debug_logger import DebugLogger
 from src.graphics.animations.animation_controller import registry
 
+# Resolved once so play/stop/bind_effect skip building log strings when "animation" is off
+DEBUG_ANIMATION = DebugLogger.is_enabled("animation")
+
+
+# ===========================================================
+# Effect Slot Pool
+# ===========================================================
+class _EffectSlot:
+    """One scheduled in-animation effect (recycled through _FREE_SLOTS)."""
+
+    __slots__ = ("trigger", "effect")
+
+
+# Released slots shared by all managers; bind_effect reuses these first
+_FREE_SLOTS = []
+
+# Tags already reported by _resolve_animation_class (log once per tag, not per spawn)
+_TAGS_LOGGED = set()
+
+
+def _release_slots(queue):
+    """Return every slot in a (trigger, seq, slot) heap to the free list and empty it."""
+    for _, _, slot in queue:
+        slot.effect = None  # Drop the callable reference while pooled
+        _FREE_SLOTS.append(slot)
+    queue.clear()
+
 
 class AnimationManager:
     """Global animation controller handling per-entity animation execution."""
 
+    __slots__ = (
+        "entity", "animations", "active_type", "_active_method",
+        "timer", "duration", "finished", "_enabled", "_runnable",
+        "on_complete", "_effect_queue", "_seq",
+    )
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -36,6 +72,7 @@ class AnimationManager:
         # Playback state
         # -------------------------------------------------------
         self.active_type = None     # Current animation name
+        self._active_method = None  # Bound handler for active_type (resolved in play())
         self.timer = 0.0            # Time elapsed since start
         self.duration = 0.0         # Total animation duration
         self.finished = False       # Completion flag
@@ -43,14 +80,17 @@ class AnimationManager:
         # -------------------------------------------------------
         # Control flags and callback
         # -------------------------------------------------------
-        self.enabled = True         # Allows disabling animations globally per entity
+        self._enabled = True        # Allows disabling animations globally per entity (see enabled)
+        self._runnable = False      # Single update() gate: enabled and playing
         self.on_complete = None     # Optional completion callback (e.g., re-enable hitbox)
-        self._effect_queue = []     # Holds animation_effects scheduled to trigger during playback
+        self._effect_queue = []     # Min-heap of (trigger, seq, slot) scheduled during playback
+        self._seq = count()         # Tie-breaker: equal triggers fire in bind order
 
-        DebugLogger.init(
-            f"AnimationManager initialized for {type(entity).__name__}",
-            category="animation"
-        )
+        if DEBUG_ANIMATION:
+            DebugLogger.init(
+                f"AnimationManager initialized for {type(entity).__name__}",
+                category="animation"
+            )
 
     # ===========================================================
     # Animation Resolver
@@ -67,12 +107,17 @@ class AnimationManager:
         """
         tag = getattr(entity, "collision_tag", "")
         anim_class = registry.get(tag)
+        first_seen = tag not in _TAGS_LOGGED
+        if first_seen:
+            _TAGS_LOGGED.add(tag)
 
         if anim_class:
-            DebugLogger.state(f"Resolved animation handler for '{tag}'", category="animation")
+            if first_seen:
+                DebugLogger.state(f"Resolved animation handler for '{tag}'", category="animation")
             return anim_class(entity)
 
-        DebugLogger.warn(f"No registered animation handler for '{tag}'", category="animation")
+        if first_seen:
+            DebugLogger.warn(f"No registered animation handler for '{tag}'", category="animation")
         return None
 
     # ===========================================================
@@ -97,27 +142,42 @@ class AnimationManager:
         self.timer = 0.0
         self.duration = duration
         self.finished = False
-        self._effect_queue.clear()
+        _release_slots(self._effect_queue)
+
+        # Resolve the handler once per play() instead of once per frame
+        method = getattr(self.animations, anim_type, None)
+        if not callable(method):
+            DebugLogger.warn(
+                f"{type(self.entity).__name__}: Unknown animation '{anim_type}'",
+                category="animation"
+            )
+            self.stop()
+            return
+        self._active_method = method
+        self._runnable = True
 
-        DebugLogger.state(
-            f"{type(self.entity).__name__}: Animation '{anim_type}' started ({duration:.2f}s)",
-            category="animation"
-        )
+        if DEBUG_ANIMATION:
+            DebugLogger.state(
+                f"{type(self.entity).__name__}: Animation '{anim_type}' started ({duration:.2f}s)",
+                category="animation"
+            )
 
     def stop(self):
         """Immediately stop the current animation and reset playback state."""
-        if self.active_type:
+        if DEBUG_ANIMATION and self.active_type:
             DebugLogger.state(
                 f"{type(self.entity).__name__}: Animation '{self.active_type}' stopped",
                 category="animation"
             )
 
         self.active_type = None
+        self._active_method = None
+        self._runnable = False
         self.timer = 0.0
         self.duration = 0.0
         self.finished = True
         self.on_complete = None
-        self._effect_queue.clear()
+        _release_slots(self._effect_queue)
 
     # ===========================================================
     # Effect Integration
@@ -132,39 +192,43 @@ class AnimationManager:
                                      If str, it will call entity.effect_manager.trigger(name).
         """
         trigger_time = max(0.0, min(trigger_time, 1.0))
-        self._effect_queue.append({
-            "trigger": trigger_time,
-            "effect": effect,
-            "fired": False,
-        })
-        DebugLogger.state(
-            f"[BindEffect] {type(self.entity).__name__}: '{effect}' @ t={trigger_time}",
-            category="animation"
-        )
+        slot = _FREE_SLOTS.pop() if _FREE_SLOTS else _EffectSlot()
+        slot.trigger = trigger_time
+        slot.effect = effect
+        heappush(self._effect_queue, (trigger_time, next(self._seq), slot))
+        if DEBUG_ANIMATION:
+            DebugLogger.state(
+                f"[BindEffect] {type(self.entity).__name__}: '{effect}' @ t={trigger_time}",
+                category="animation"
+            )
 
     def _check_effect_triggers(self, t: float):
         """Execute any animation_effects whose trigger times have been reached."""
-        for fx in list(self._effect_queue):
-            if not fx["fired"] and t >= fx["trigger"]:
-                fx["fired"] = True
-                eff = fx["effect"]
-
-                try:
-                    if callable(eff):
-                        eff(self.entity)
-                    elif isinstance(eff, str):
-                        if hasattr(self.entity, "effect_manager"):
-                            self.entity.status_manager.trigger(eff)
-                        else:
-                            DebugLogger.warn(
-                                f"[EffectSkip] {self.entity.collision_tag} has no effect_manager for '{eff}'",
-                                category="animation_effects"
-                            )
-                except Exception as e:
-                    DebugLogger.warn(
-                        f"[EffectFail] {eff} on {self.entity.collision_tag} → {e}",
-                        category="animation_effects"
-                    )
+        queue = self._effect_queue
+
+        # Earliest trigger sits at the head: idle frames cost one comparison,
+        # and a popped slot is a fired slot (no per-entry flag to scan)
+        while queue and queue[0][0] <= t:
+            slot = heappop(queue)[2]
+            eff = slot.effect
+            slot.effect = None
+            _FREE_SLOTS.append(slot)
+            try:
+                if callable(eff):
+                    eff(self.entity)
+                elif isinstance(eff, str):
+                    if hasattr(self.entity, "effect_manager"):
+                        self.entity.status_manager.trigger(eff)
+                    else:
+                        DebugLogger.warn(
+                            f"[EffectSkip] {self.entity.collision_tag} has no effect_manager for '{eff}'",
+                            category="animation_effects"
+                        )
+            except Exception as e:
+                DebugLogger.warn(
+                    f"[EffectFail] {eff} on {self.entity.collision_tag} → {e}",
+                    category="animation_effects"
+                )
 
     # ===========================================================
     # Update Loop
@@ -176,57 +240,65 @@ class AnimationManager:
         Args:
             dt (float): Delta time (seconds) since the last frame.
         """
-        if not self.enabled or not getattr(self.entity, "alive", True):
+        # Idle, stopped, or paused (dt == 0): nothing to advance
+        if not self._runnable or dt <= 0.0:
             return
-        if not self.active_type or not self.animations:
+        # Liveness can change mid-animation: freeze (not reset) while dead
+        if not getattr(self.entity, "alive", True):
             return
+        method = self._active_method
 
-        try:
-            # -------------------------------------------------------
-            # 1) Advance animation progress and normalize to [0.0, 1.0]
-            # -------------------------------------------------------
-            self.timer += dt
-            t = min(1.0, self.timer / max(self.duration, 1e-6))  # Avoid division by zero
-
-            # -------------------------------------------------------
-            # 2) Execute the animation method if defined
-            # -------------------------------------------------------
-            method = getattr(self.animations, self.active_type, None)
-            if callable(method):
-                method(t)
-                # Fire queued animation_effects when appropriate
-                self._check_effect_triggers(t)
-            else:
-                DebugLogger.warn(
-                    f"{type(self.entity).__name__}: Unknown animation '{self.active_type}'",
-                    category="animation"
-                )
-                self.stop()
-                return
-
-            # -------------------------------------------------------
-            # 3) Stop when finished and trigger optional callback
-            # -------------------------------------------------------
-            if t >= 1.0:
-                if callable(self.on_complete):
-                    try:
-                        self.on_complete(self.entity, self.active_type)
-                    except Exception as e:
-                        DebugLogger.warn(
-                            f"Animation '{self.active_type}' callback failed → {e}",
-                            category="animation"
-                        )
-                self.stop()
+        # -------------------------------------------------------
+        # 1) Advance animation progress and normalize to [0.0, 1.0]
+        # -------------------------------------------------------
+        timer = self.timer + dt
+        self.timer = timer
+        duration = self.duration
+        t = timer / (duration if duration > 1e-6 else 1e-6)  # Avoid division by zero
+        if t > 1.0:
+            t = 1.0
 
+        # -------------------------------------------------------
+        # 2) Execute the animation method and fire queued effects
+        #    (only the handler code is guarded: fail-safe stop)
+        # -------------------------------------------------------
+        try:
+            method(t)
+            self._check_effect_triggers(t)
         except Exception as e:
-            # -------------------------------------------------------
-            # 4) Fail-safe: gracefully stop faulty animations
-            # -------------------------------------------------------
             DebugLogger.warn(
                 f"{type(self.entity).__name__}: Animation '{self.active_type}' failed → {e}",
                 category="animation"
             )
             self.stop()
+            return
+
+        # -------------------------------------------------------
+        # 3) Stop when finished and trigger optional callback
+        # -------------------------------------------------------
+        if t >= 1.0:
+            if callable(self.on_complete):
+                try:
+                    self.on_complete(self.entity, self.active_type)
+                except Exception as e:
+                    DebugLogger.warn(
+                        f"Animation '{self.active_type}' callback failed → {e}",
+                        category="animation"
+                    )
+            self.stop()
+
+    # ===========================================================
+    # Run Gate
+    # ===========================================================
+    @property
+    def enabled(self) -> bool:
+        """Whether this manager plays animations at all."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = value
+        self._runnable = bool(value) and self._active_method is not None
 
     # ===========================================================
     # Utility
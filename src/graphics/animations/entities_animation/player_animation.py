@@ -7,7 +7,7 @@ All player animations centralized here for easy tuning.
 """
 
 from ..animation_effects.death_animation import death_fade
-from ..animation_effects.common_animation import blink, fade_color
+from ..animation_effects.common_animation import blink, fade_color, SCALE_STEPS, enter_step
 from src.core.debug.debug_logger import DebugLogger
 
 
@@ -37,17 +37,29 @@ def damage_player(entity, t):
     target_state = ctx.get('target_state', entity._current_visual_state)
 
     if entity.render_mode == "shape":
-        start_color = entity.get_target_color(previous_state)
-        end_color = entity.get_target_color(target_state)
+        # Stepped color ramp for this (previous, target) pair, built once per play()
+        ramp = ctx.get('_color_ramp')
+        if ramp is None:
+            start_color = entity.get_target_color(previous_state)
+            end_color = entity.get_target_color(target_state)
+            last = SCALE_STEPS - 1
+            ramp = [
+                tuple(
+                    int(start_color[i] + (end_color[i] - start_color[i]) * step / last)
+                    for i in range(3)
+                )
+                for step in range(SCALE_STEPS)
+            ]
+            ctx['_color_ramp'] = ramp
 
-        # Lerp color directly
-        current_color = tuple(
-            int(start_color[i] + (end_color[i] - start_color[i]) * t)
-            for i in range(3)
-        )
-
-        # Rebake shape with interpolated color
-        entity.refresh_visual(new_color=current_color)
+        # Rebake shape only when the ramp moves to a new step whose color
+        # actually differs (close colors repeat across neighbouring steps)
+        step = enter_step(entity, t, SCALE_STEPS, "_color_step")
+        if step is not None:
+            color = ramp[step]
+            if color != ctx.get('_last_color'):
+                entity.refresh_visual(new_color=color)
+                ctx['_last_color'] = color
 
         # Apply blink on top
         blink(entity, t, interval=interval)
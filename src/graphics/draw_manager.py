@@ -8,62 +8,152 @@ Responsibilities
 ----------------
 - Load and cache images used by entities_animation and UI.
 - Maintain a draw queue (layered rendering system).
-- Sort queued draw calls by layer each frame and render them.
+- Render queued draw calls in layer order (order re-sorted only when a layer is added).
 - Provide helper methods for entities_animation and UI elements to queue themselves.
 """
 
 import pygame
 import math
 import os
+from collections import defaultdict, OrderedDict
 from src.core.debug.debug_logger import DebugLogger
+from src.core.runtime.game_settings import Layers
+
+
+def _shape_groups():
+    """Per-layer shape queue: {shape_type: [(rect, color, width, kwargs), ...]}."""
+    return defaultdict(list)
+
+
+def _display_format(surface, alpha=True):
+    """
+    Convert a runtime-created surface to the display's pixel format.
+
+    No-op before a display mode is set (headless tools/tests), where
+    convert()/convert_alpha() would raise.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+# Prebaked shape surfaces kept for reuse; least recently used are dropped past this
+_SHAPE_CACHE_SIZE = 256
+
+
+# Game layers known up front: their buckets exist (pre-sorted) from the start
+_DEFAULT_LAYERS = sorted(
+    value for name, value in vars(Layers).items()
+    if not name.startswith("_") and isinstance(value, int)
+)
 
 
 class DrawManager:
     """Centralized rendering manager that handles all draw operations."""
 
+    _ICON_DIR = os.path.join("assets", "images", "icons")
+
     # ===========================================================
     # Initialization
     # ===========================================================
     def __init__(self):
         self.images = {}
-        # Layer buckets instead of flat queue
-        self.layers = {}  # {layer: [(surface, rect), ...]}
-        self._layer_keys_cache = []
-        self._layers_dirty = False
+        self._triangle_cache = {}  # {(size, color, pointing): Surface}
+        self._icon_cache = {}  # {(name, size): Surface} - hits skip key formatting
+        self._path_cache = {}  # {(path, scale): Surface} - load_image decodes each file once
+        self._shape_cache = OrderedDict()  # {(type, size, color, kwargs): Surface}, LRU-bounded
+        # Layer buckets instead of flat queue, split by kind so render()
+        # never type-checks items; an unseen layer gets its bucket on first append
+        # {layer: [(surface, rect), ...]}
+        self.layers = defaultdict(list, {layer: [] for layer in _DEFAULT_LAYERS})
+        # {layer: {shape_type: [(rect, color, width, kwargs), ...]}}
+        self._shape_layers = defaultdict(
+            _shape_groups, {layer: _shape_groups() for layer in _DEFAULT_LAYERS}
+        )
+        # [(layer, surfaces, shapes), ...] in draw order; rebuilt by render() only
+        # when a bucket count shows a new layer has appeared
+        self._layer_order = []
+        self._rebuild_layer_order()
         self.surface = None  # Expose active surface for debug/hitbox draws
         self.background = None  # Cached background surface (optional)
-        self.debug_hitboxes = []  # Persistent list for queued hitboxes
+        # Queued hitboxes as parallel slot lists + live count: slots are
+        # overwritten in place each frame, clear() only resets the count
+        self._hb_rects = []
+        self._hb_colors = []
+        self._hb_widths = []
+        self._hb_count = 0
         DebugLogger.init_entry("DrawManager")
 
     # --------------------------------------------------------
     # Image Loading
     # --------------------------------------------------------
-    def load_image(self, key, path, scale=1.0):
+    def load_image(self, key, path, scale=1.0, has_alpha=None, force_reload=False):
         """
         Load an image from file and store it in the cache.
 
+        Opaque images are converted with convert() instead of convert_alpha(),
+        so blitting them skips per-pixel alpha blending. Each file is decoded
+        once; other scales are derived from that decoded surface.
+
         Args:
             key (str): Identifier used to retrieve this image later.
             path (str): File path to the image asset.
             scale (float): Optional scaling factor to resize the image.
+            has_alpha (bool | None): Force alpha handling on/off.
+                                     None detects it from the pixel data.
+            force_reload (bool): Re-read the file even if key/path is cached.
         """
-        try:
-            img = pygame.image.load(path).convert_alpha()
-            # DebugLogger.action(f"Loaded image '{key}' from {path}")
+        if force_reload:
+            for cache_key in [k for k in self._path_cache if k[0] == path]:
+                del self._path_cache[cache_key]
+        elif key in self.images:
+            return
 
-        except FileNotFoundError:
-            DebugLogger.warn(f"Missing image at {path}")
-            img = pygame.Surface((40, 40))
-            img.fill((255, 255, 255))
+        cached = self._path_cache.get((path, scale))
+        if cached is not None:
+            self.images[key] = cached
+            return
 
+        # Unscaled surface: decoded from disk at most once per path
+        base = self._path_cache.get((path, 1.0))
+        if base is None:
+            try:
+                base = pygame.image.load(path)
+                if has_alpha is None:
+                    has_alpha = self._has_transparency(base)
+                base = base.convert_alpha() if has_alpha else base.convert()
+                self._path_cache[(path, 1.0)] = base
+                # DebugLogger.action(f"Loaded image '{key}' from {path}")
+
+            except FileNotFoundError:
+                DebugLogger.warn(f"Missing image at {path}")
+                base = _display_format(pygame.Surface((40, 40)), alpha=False)
+                base.fill((255, 255, 255))
+                path = None  # Placeholder: not cached, so a later call retries the file
+
+        img = base
         if scale != 1.0:
             w, h = img.get_size()
             img = pygame.transform.scale(img, (int(w * scale), int(h * scale)))
             # print(f"[DrawManager] SCALE: '{key}' → {img.get_size()} ({scale}x)")
             DebugLogger.state(f"Scaled '{key}' to {img.get_size()} ({scale:.2f}x)")
+            if path is not None:
+                self._path_cache[(path, scale)] = img
 
         self.images[key] = img
 
+    @staticmethod
+    def _has_transparency(img):
+        """Return True if any pixel of a freshly loaded image is not fully opaque."""
+        if img.get_colorkey() is not None:
+            return True
+        if not img.get_flags() & pygame.SRCALPHA:
+            return False  # No alpha channel at all (e.g., JPG, RGB PNG)
+
+        # Alpha channel present: opaque only if every pixel has alpha 255
+        w, h = img.get_size()
+        return pygame.mask.from_surface(img, 254).count() != w * h
+
     def load_icon(self, name, size=(24, 24)):
         """
         Load or retrieve a cached UI icon.
@@ -75,11 +165,18 @@ class DrawManager:
         Returns:
             pygame.Surface: The loaded or cached icon surface.
         """
+        # Fast path: tuple key, no string building on repeat requests
+        fast_key = (name, tuple(size))
+        img = self._icon_cache.get(fast_key)
+        if img is not None:
+            return img
+
         key = f"icon_{name}_{size[0]}x{size[1]}"
         if key in self.images:
-            return self.images[key]
+            img = self._icon_cache[fast_key] = self.images[key]
+            return img
 
-        path = os.path.join("assets", "images", "icons", f"{name}.png")
+        path = os.path.join(self._ICON_DIR, f"{name}.png")
         try:
             img = pygame.image.load(path).convert_alpha()
             img = pygame.transform.scale(img, size)
@@ -87,12 +184,13 @@ class DrawManager:
             DebugLogger.action(f"Loaded icon '{name}' ({size[0]}x{size[1]})")
 
         except FileNotFoundError:
-            img = pygame.Surface(size, pygame.SRCALPHA)
+            img = _display_format(pygame.Surface(size, pygame.SRCALPHA))
             pygame.draw.rect(img, (255, 255, 255), img.get_rect(), 1)
             self.images[key] = img
             DebugLogger.warn(f"Missing icon '{name}' at {path}")
 
-        return self.images[key]
+        img = self._icon_cache[fast_key] = self.images[key]
+        return img
 
     def get_image(self, key):
         """
@@ -120,15 +218,26 @@ class DrawManager:
         -------------
         Avoids recreating the dictionary every frame.
         Simply clears existing layer lists to reduce
-        Python-level allocations and GC churn.
+        Python-level allocations and GC churn. Buckets (and
+        their draw order) persist across frames.
         """
         for layer_items in self.layers.values():
             layer_items.clear()
-
-        if hasattr(self, "debug_hitboxes"):
-            self.debug_hitboxes.clear()
-
-        self._layers_dirty = True
+        for shape_groups in self._shape_layers.values():
+            for shape_items in shape_groups.values():
+                shape_items.clear()
+
+        self._hb_count = 0
+
+    def _rebuild_layer_order(self):
+        """Sort all known layers and pair each with its surface and shape buckets."""
+        layers, shape_layers = self.layers, self._shape_layers
+        # Indexing both defaultdicts gives every layer both buckets, so the
+        # two dicts always hold the same keys afterwards
+        self._layer_order = [
+            (layer, layers[layer], shape_layers[layer])
+            for layer in sorted(layers.keys() | shape_layers.keys())
+        ]
 
     def queue_draw(self, surface, rect, layer=0):
         """
@@ -143,10 +252,6 @@ class DrawManager:
             DebugLogger.warn(f"Skipped invalid draw call at layer {layer}")
             return
 
-        if layer not in self.layers:
-            self.layers[layer] = []
-            self._layers_dirty = True
-
         self.layers[layer].append((surface, rect))
 
     def draw_entity(self, entity, layer=0):
@@ -172,11 +277,18 @@ class DrawManager:
         parameters instead of allocating `pygame.Surface` objects.
         These are drawn directly during render() for near-zero overhead.
         """
-        if not hasattr(self, "debug_hitboxes"):
-            self.debug_hitboxes = []
-
-        # Store draw command for later rendering (no surface creation)
-        self.debug_hitboxes.append((rect, color, width))
+        # Store draw command for later rendering (no surface creation);
+        # reuse the slot from a previous frame when there is one
+        i = self._hb_count
+        if i < len(self._hb_rects):
+            self._hb_rects[i] = rect
+            self._hb_colors[i] = color
+            self._hb_widths[i] = width
+        else:
+            self._hb_rects.append(rect)
+            self._hb_colors.append(color)
+            self._hb_widths.append(width)
+        self._hb_count = i + 1
 
     # ===========================================================
     # Shape Queueing
@@ -192,12 +304,10 @@ class DrawManager:
             layer (int): Rendering layer (lower values draw first).
             **kwargs: Additional shape-specific parameters (e.g., width, points).
         """
-        if layer not in self.layers:
-            self.layers[layer] = []
-            self._layers_dirty = True
-
-        # Add tagged shape command for later rendering
-        self.layers[layer].append(("shape", shape_type, rect, color, kwargs))
+        # Group by shape type so render() dispatches once per type, not per shape
+        self._shape_layers[layer][shape_type].append(
+            (rect, color, kwargs.get("width", 0), kwargs)
+        )
 
     # ===========================================================
     # Shape Prebaking (Optimization)
@@ -229,22 +339,36 @@ class DrawManager:
             )
             super().__init__(x, y, image=bullet_sprite)
         """
-        # Create cache key for reusing identical shapes
-        cache_key = f"shape_{type}_{size}_{color}_{tuple(sorted(kwargs.items()))}"
+        # Tuple key for reusing identical shapes (no string formatting);
+        # kwargs holding lists (e.g. polygon points) fall back to their repr
+        kw_key = tuple(sorted(kwargs.items())) if kwargs else ()
+        cache_key = (type, tuple(size), tuple(color), kw_key)
+        try:
+            hash(cache_key)
+        except TypeError:
+            cache_key = (type, tuple(size), tuple(color), repr(kw_key))
 
-        # Return cached version if it exists
-        if cache_key in self.images:
-            return self.images[cache_key]
+        # Return cached version if it exists (and mark it recently used)
+        shape_cache = self._shape_cache
+        surface = shape_cache.get(cache_key)
+        if surface is not None:
+            shape_cache.move_to_end(cache_key)
+            return surface
 
         # Create new surface with transparency
         surface = pygame.Surface(size, pygame.SRCALPHA)
         temp_rect = pygame.Rect(0, 0, *size)
 
-        # Draw shape onto surface
+        # Draw shape onto surface, then match the display's pixel format
+        # so every later blit of this sprite skips format conversion
         self._draw_shape(surface, type, temp_rect, color, **kwargs)
+        surface = _display_format(surface)
 
-        # Cache for reuse
-        self.images[cache_key] = surface
+        # Cache for reuse; entities keep their own reference, so eviction
+        # only means the next identical request bakes it again
+        shape_cache[cache_key] = surface
+        if len(shape_cache) > _SHAPE_CACHE_SIZE:
+            shape_cache.popitem(last=False)
 
         DebugLogger.trace(f"Prebaked shape: {type} {size} {color}")
 
@@ -264,6 +388,12 @@ class DrawManager:
         Returns:
             pygame.Surface: Cached triangle image.
         """
+        # Fast path: repeat requests skip the geometry and string key entirely
+        fast_key = (size if isinstance(size, int) else tuple(size), tuple(color), pointing)
+        surface = self._triangle_cache.get(fast_key)
+        if surface is not None:
+            return surface
+
         if isinstance(size, int):
             w = size
             h = int((math.sqrt(3) / 2) * w)  # 60° equilateral triangle height
@@ -272,7 +402,8 @@ class DrawManager:
 
         cache_key = f"triangle_{w}x{h}_{color}_{pointing}"
         if cache_key in self.images:
-            return self.images[cache_key]
+            surface = self._triangle_cache[fast_key] = self.images[cache_key]
+            return surface
 
         # Define points based on direction
         if pointing == "up":
@@ -294,6 +425,7 @@ class DrawManager:
             points=points
         )
         self.images[cache_key] = surface
+        self._triangle_cache[fast_key] = surface
         return surface
 
     # ===========================================================
@@ -311,60 +443,67 @@ class DrawManager:
         # -------------------------------------------------------
         # Background rendering (cached surface to avoid fill cost)
         # -------------------------------------------------------
-        if hasattr(self, "background") and self.background is not None:
+        if self.background is not None:
             target_surface.blit(self.background, (0, 0))
         else:
             target_surface.fill((50, 50, 100))  # fallback solid color
 
-        # Cache sorted layer keys to avoid sorting every frame
-        if self._layers_dirty:
-            self._layer_keys_cache = sorted(self.layers.keys())
-            self._layers_dirty = False
+        # New layer(s) queued since the last sort (rare): rebuild draw order
+        layer_count = len(self._layer_order)
+        if len(self.layers) != layer_count or len(self._shape_layers) != layer_count:
+            self._rebuild_layer_order()
 
         # -------------------------------------------------------
-        # Render each layer (surfaces + shapes)
+        # Render each layer (surfaces + shapes) in pre-sorted order
         # -------------------------------------------------------
-        for layer in self._layer_keys_cache:
-            items = self.layers[layer]
-            if not items:
-                continue
-
-            # Detect if layer contains shape commands
-            shape_items = []
-            surface_items = []
-            for item in items:
-                if isinstance(item[0], str):
-                    shape_items.append(item)
-                elif isinstance(item[0], pygame.Surface):
-                    surface_items.append(item)
-
+        for _, items, shapes in self._layer_order:
             # Batch blit all standard surfaces in one call
-            if surface_items:
-                target_surface.blits(surface_items)
+            # (doreturn=False: skip building the list of dirty rects)
+            if items:
+                target_surface.blits(items, doreturn=False)
 
-            # Draw primitive shapes (rects, circles, etc.)
-            for item in shape_items:
-                _, shape_type, rect, color, kwargs = item
-                self._draw_shape(target_surface, shape_type, rect, color, **kwargs)
+            # Draw primitive shapes (rects, circles, etc.), one batch per type
+            for shape_type, shape_items in shapes.items():
+                if shape_items:
+                    self._draw_shape_batch(target_surface, shape_type, shape_items)
 
         if debug:
-            draw_count = sum(len(items) for items in self.layers.values())
+            draw_count = (sum(len(items) for items in self.layers.values())
+                          + sum(len(shape_items)
+                                for shape_groups in self._shape_layers.values()
+                                for shape_items in shape_groups.values()))
             DebugLogger.state(f"Rendered {draw_count} queued surfaces and shapes", category="drawing")
 
         # -------------------------------------------------------
         # Optional debug overlay pass (hitboxes)
         # -------------------------------------------------------
-        if hasattr(self, "debug_hitboxes") and self.debug_hitboxes:
-            """
-            Directly draw debug hitboxes to avoid temporary surface allocation.
-            Each tuple: (rect, color, width)
-            """
-            for rect, color, width in self.debug_hitboxes:
-                pygame.draw.rect(target_surface, color, rect, width)
+        hb_count = self._hb_count
+        if hb_count:
+            # Directly draw debug hitboxes to avoid temporary surface allocation
+            draw_rect = pygame.draw.rect
+            rects, colors, widths = self._hb_rects, self._hb_colors, self._hb_widths
+            for i in range(hb_count):
+                draw_rect(target_surface, colors[i], rects[i], widths[i])
 
     # ===========================================================
     # Shape Rendering Helper
     # ===========================================================
+    def _draw_shape_batch(self, surface: pygame.Surface, shape_type: str, items) -> None:
+        """
+        Draw every queued shape of one type with a single dispatch.
+
+        Args:
+            surface (pygame.Surface): Target surface to draw onto.
+            shape_type (str): Shape type shared by all items.
+            items (list): [(rect, color, width, kwargs), ...] from queue_shape().
+        """
+        draw = _SHAPE_DISPATCH.get(shape_type)
+        if draw is None:
+            DebugLogger.warn(f"Unknown shape type: {shape_type}")
+            return
+        for rect, color, width, kwargs in items:
+            draw(surface, rect, color, width, kwargs)
+
     def _draw_shape(self, surface: pygame.Surface, shape_type: str,
                     rect: pygame.Rect, color: tuple[int, int, int], **kwargs) -> None:
         """
@@ -377,22 +516,47 @@ class DrawManager:
             color (tuple[int, int, int]): RGB color.
             **kwargs: Optional keyword args (e.g., width, points, start_pos, end_pos).
         """
-        width = kwargs.get("width", 0)
-
-        if shape_type == "rect":
-            pygame.draw.rect(surface, color, rect, width)
-        elif shape_type == "circle":
-            pygame.draw.circle(surface, color, rect.center, rect.width // 2, width)
-        elif shape_type == "ellipse":
-            pygame.draw.ellipse(surface, color, rect, width)
-        elif shape_type == "polygon":
-            points = kwargs.get("points", [])
-            if points:
-                pygame.draw.polygon(surface, color, points, width)
-        elif shape_type == "line":
-            start = kwargs.get("start_pos")
-            end = kwargs.get("end_pos")
-            if start and end:
-                pygame.draw.line(surface, color, start, end, width)
-        else:
+        draw = _SHAPE_DISPATCH.get(shape_type)
+        if draw is None:
             DebugLogger.warn(f"Unknown shape type: {shape_type}")
+            return
+        draw(surface, rect, color, kwargs.get("width", 0), kwargs)
+
+
+# ===========================================================
+# Shape Draw Dispatch
+# ===========================================================
+def _draw_rect(surface, rect, color, width, kwargs):
+    pygame.draw.rect(surface, color, rect, width)
+
+
+def _draw_circle(surface, rect, color, width, kwargs):
+    pygame.draw.circle(surface, color, rect.center, rect.width // 2, width)
+
+
+def _draw_ellipse(surface, rect, color, width, kwargs):
+    pygame.draw.ellipse(surface, color, rect, width)
+
+
+def _draw_polygon(surface, rect, color, width, kwargs):
+    points = kwargs.get("points", [])
+    if points:
+        pygame.draw.polygon(surface, color, points, width)
+
+
+def _draw_line(surface, rect, color, width, kwargs):
+    start = kwargs.get("start_pos")
+    end = kwargs.get("end_pos")
+    if start and end:
+        pygame.draw.line(surface, color, start, end, width)
+
+
+# {shape_type: drawer(surface, rect, color, width, kwargs)} - one dict lookup
+# replaces the if/elif string-compare chain in the shape draw paths
+_SHAPE_DISPATCH = {
+    "rect": _draw_rect,
+    "circle": _draw_circle,
+    "ellipse": _draw_ellipse,
+    "polygon": _draw_polygon,
+    "line": _draw_line,
+}
@@ -0,0 +1,45 @@
+"""
+image_cache.py
+--------------
+Process-wide cache of loaded, display-converted, and scaled image surfaces.
+
+Responsibilities
+----------------
+- Load each (path, size) pair from disk at most once.
+- Always apply convert_alpha() before caching so blits need no format conversion.
+- Share the resulting surfaces between entities (e.g., across player respawns).
+"""
+
+import pygame
+
+# {(path, (w, h) | None): pygame.Surface}
+_cache = {}
+
+
+def load_scaled(path, size=None):
+    """
+    Return the image at path, converted and scaled to size (cached).
+
+    The returned surface is shared: callers that draw into it must copy() it
+    first. Per-surface alpha changes (set_alpha) are visible to all users.
+
+    Args:
+        path (str): Image file path.
+        size (tuple[int, int], optional): Target size. None keeps native size.
+
+    Returns:
+        pygame.Surface: Cached surface.
+    """
+    key = (path, size)
+    surface = _cache.get(key)
+    if surface is None:
+        surface = pygame.image.load(path).convert_alpha()
+        if size is not None and surface.get_size() != size:
+            surface = pygame.transform.scale(surface, size)
+        _cache[key] = surface
+    return surface
+
+
+def clear():
+    """Drop all cached surfaces (e.g., after an asset reload)."""
+    _cache.clear()
@@ -12,8 +12,6 @@ Responsibilities
 - Forward input and events to appropriate subsystems.
 """
 
-import pygame
-
 # Core Systems
 from src.core.debug.debug_logger import DebugLogger
 from src.core.runtime.game_settings import Debug
@@ -168,7 +166,7 @@ class GameScene:
         self.spawn_manager.cleanup()
 
         # 7. UI
-        self.ui.update(pygame.mouse.get_pos())
+        self.ui.update(self.input_manager.mouse_pos)
 
         # if not self.level_manager.active:  # when current stage finishes
         #     next_stage = self._get_next_stage()
@@ -16,7 +16,7 @@ Responsibilities
 
 from src.core.runtime.game_settings import Debug
 from src.core.debug.debug_logger import DebugLogger
-from src.entities.entity_state import LifecycleState
+from src.entities.entity_state import DEAD
 from src.entities.player.player_state import InteractionState
 from src.systems.collision.collision_hitbox import CollisionHitbox
 
@@ -28,10 +28,7 @@ class CollisionManager:
     # Configuration
     # ===========================================================
     BASE_CELL_SIZE = 64
-    NEIGHBOR_OFFSETS = [
-        (0, 0), (1, 0), (-1, 0), (0, 1), (0, -1),
-        (1, 1), (-1, 1), (1, -1), (-1, -1)
-    ]
+    BRUTE_FORCE_THRESHOLD = 32  # Below this many hitboxes, all-pairs beats hashing
 
     # ===========================================================
     # Initialization
@@ -61,6 +58,9 @@ class CollisionManager:
         # Centralized hitbox registry
         self.hitboxes = {}  # {entity_id: CollisionHitbox}
 
+        # Spatial hash reused across frames (cleared, not reallocated)
+        self._grid = {}  # {(cell_x, cell_y): [(entity, hitbox), ...]}
+
         DebugLogger.init_entry("CollisionManager Initialized")
 
     # ===========================================================
@@ -125,38 +125,13 @@ class CollisionManager:
         for entity_id, hitbox in list(self.hitboxes.items()):
             # Clean up hitboxes for dead entities_animation
             entity = hitbox.owner
-            if getattr(entity, "death_state", 0) >= LifecycleState.DEAD:
+            if getattr(entity, "death_state", 0) >= DEAD:
                 del self.hitboxes[entity_id]
                 continue
 
             # Update hitbox position/size
             hitbox.update()
 
-    # ===========================================================
-    # Utility: Grid Assignment
-    # ===========================================================
-    def _add_to_grid(self, grid, obj):
-        """
-        Assign an entity to a grid cell based on its hitbox.
-
-        Args:
-            grid: Spatial hash table mapping cell → list of entities_animation.
-            obj: Any entity with a registered hitbox.
-        """
-        hitbox = self.hitboxes.get(id(obj))
-        if not hitbox:
-            return
-
-        rect = hitbox.rect
-        start_x = int(rect.left // self.CELL_SIZE)
-        end_x   = int(rect.right // self.CELL_SIZE)
-        start_y = int(rect.top // self.CELL_SIZE)
-        end_y   = int(rect.bottom // self.CELL_SIZE)
-
-        for cx in range(start_x, end_x + 1):
-            for cy in range(start_y, end_y + 1):
-                grid.setdefault((cx, cy), []).append(obj)
-
     # ===========================================================
     # Optimized Collision Detection
     # ===========================================================
@@ -165,6 +140,9 @@ class CollisionManager:
         Optimized collision detection using spatial hashing.
 
         Groups entities_animation by screen regions to minimize redundant checks.
+        Each hitbox is inserted into every cell its rect overlaps, so only
+        objects sharing a cell can collide. Small scenes skip the grid and
+        test all pairs directly.
         Delegates all responses to each entity's on_collision() method.
 
         Returns:
@@ -176,18 +154,47 @@ class CollisionManager:
         # Pre-filter active objects
         active_bullets = [
             b for b in getattr(self.bullet_manager, "active", [])
-            if getattr(b, "death_state", 0) < LifecycleState.DEAD
+            if getattr(b, "death_state", 0) < DEAD
         ]
         active_entities = [
             e for e in getattr(self.spawn_manager, "entities", [])
-            if getattr(e, "death_state", 0) < LifecycleState.DEAD
+            if getattr(e, "death_state", 0) < DEAD
         ]
-        player = self.player if getattr(self.player, "death_state", 0) < LifecycleState.DEAD else None
+        player = self.player if getattr(self.player, "death_state", 0) < DEAD else None
 
         total_entities = len(active_bullets) + len(active_entities) + (1 if player else 0)
         if total_entities == 0:
             return collisions
 
+        # Pair every object with its active hitbox once
+        get_hitbox = self.hitboxes.get
+        tracked = []
+
+        if player:
+            hitbox = get_hitbox(id(player))
+            if hitbox and hitbox.active:
+                tracked.append((player, hitbox))
+        for entity in active_entities:
+            if entity is player:
+                DebugLogger.warn("WARNING: Player found in spawn_manager entities!")
+                continue
+            hitbox = get_hitbox(id(entity))
+            if hitbox and hitbox.active:
+                tracked.append((entity, hitbox))
+        for bullet in active_bullets:
+            hitbox = get_hitbox(id(bullet))
+            if hitbox and hitbox.active:
+                tracked.append((bullet, hitbox))
+
+        test_pair = self._test_pair
+
+        # Small scenes: all-pairs is cheaper than building the grid
+        if len(tracked) < self.BRUTE_FORCE_THRESHOLD:
+            for i, (a, a_hitbox) in enumerate(tracked):
+                for b, b_hitbox in tracked[i + 1:]:
+                    test_pair(a, a_hitbox, b, b_hitbox, collisions)
+            return collisions
+
         # Dynamic grid size adjustment
         if total_entities > 800:
             self.CELL_SIZE = 48
@@ -197,89 +204,94 @@ class CollisionManager:
             self.CELL_SIZE = self.BASE_CELL_SIZE
 
         # Build Spatial Grid
-        grid = {}
-        add_to_grid = self._add_to_grid
+        cell_size = self.CELL_SIZE
+        grid = self._grid
+        grid.clear()
+
+        for entry in tracked:
+            rect = entry[1].rect
+            for cx in range(rect.left // cell_size, rect.right // cell_size + 1):
+                for cy in range(rect.top // cell_size, rect.bottom // cell_size + 1):
+                    cell = grid.get((cx, cy))
+                    if cell is None:
+                        grid[(cx, cy)] = [entry]
+                    else:
+                        cell.append(entry)
+
+        # Localized Collision Checks (objects sharing a cell)
+        checked_pairs = set()
 
-        if player:
-            add_to_grid(grid, player)
-        for entity in active_entities:
-            if entity is player:
-                DebugLogger.warn("WARNING: Player found in spawn_manager entities!")
+        for cell_objects in grid.values():
+            count = len(cell_objects)
+            if count < 2:
                 continue
-            add_to_grid(grid, entity)
-
-        for bullet in active_bullets:
-            add_to_grid(grid, bullet)
 
-        # Localized Collision Checks (per cell + neighbors)
-        checked_pairs = set()
-        append_collision = collisions.append
-        get_hitbox = self.hitboxes.get
+            for i in range(count - 1):
+                a, a_hitbox = cell_objects[i]
+                id_a = id(a)
 
-        for cell_key, cell_objects in grid.items():
-            for dx, dy in self.NEIGHBOR_OFFSETS:
-                neighbor_key = (cell_key[0] + dx, cell_key[1] + dy)
-                neighbor_objs = grid.get(neighbor_key)
-                if not neighbor_objs:
-                    continue
+                for j in range(i + 1, count):
+                    b, b_hitbox = cell_objects[j]
+                    id_b = id(b)
 
-                for a in cell_objects:
-                    a_hitbox = get_hitbox(id(a))
-                    if not a_hitbox or not getattr(a_hitbox, "active", True):
+                    # Avoid redundant duplicate checks (pairs spanning several cells)
+                    pair_key = (id_a, id_b) if id_a < id_b else (id_b, id_a)
+                    if pair_key in checked_pairs:
                         continue
+                    checked_pairs.add(pair_key)
+
+                    test_pair(a, a_hitbox, b, b_hitbox, collisions)
 
-                    for b in neighbor_objs:
-                        if a is b:
-                            continue
-
-                        b_hitbox = get_hitbox(id(b))
-                        if not b_hitbox or not getattr(b_hitbox, "active", True):
-                            continue
-
-                        # Avoid redundant duplicate checks
-                        pair_key = tuple(sorted((id(a), id(b))))
-                        if pair_key in checked_pairs:
-                            continue
-                        checked_pairs.add(pair_key)
-
-                        # Skip destroyed entities_animation mid-frame
-                        if a.death_state >= LifecycleState.DEAD or b.death_state >= LifecycleState.DEAD:
-                            continue
-
-                        # Tag-based collision filtering
-                        tag_a = getattr(a, "collision_tag", None)
-                        tag_b = getattr(b, "collision_tag", None)
-                        if (tag_a, tag_b) not in self.rules and (tag_b, tag_a) not in self.rules:
-                            continue
-
-                        if (getattr(a, "state", 0) >= InteractionState.INTANGIBLE or
-                                getattr(b, "state", 0) >= InteractionState.INTANGIBLE):
-                            continue
-
-                        # Overlap test
-                        if a_hitbox.rect.colliderect(b_hitbox.rect):
-                            append_collision((a, b))
-                            DebugLogger.state(
-                                f"Collision: {type(a).__name__} ({tag_a}) <-> {type(b).__name__} ({tag_b})",
-                                category="collision",
-                            )
-
-                            # Let entities_animation handle their reactions
-                            try:
-                                if hasattr(a, "on_collision"):
-                                    a.on_collision(b)
-
-                                if hasattr(b, "on_collision"):
-                                    b.on_collision(a)
-
-                            except Exception as e:
-                                DebugLogger.warn(
-                                    f"[CollisionManager] Exception during collision between "
-                                    f"{type(a).__name__} and {type(b).__name__}: {e}",
-                                    category="collision"
-                                )
         return collisions
 
+    def _test_pair(self, a, a_hitbox, b, b_hitbox, collisions):
+        """
+        Narrow-phase test for one candidate pair; dispatches on_collision on overlap.
+
+        Args:
+            a, b: Candidate entities.
+            a_hitbox, b_hitbox: Their registered hitboxes.
+            collisions (list): Output list receiving (a, b) on overlap.
+        """
+        # Skip destroyed entities_animation mid-frame
+        if a.death_state >= DEAD or b.death_state >= DEAD:
+            return
+
+        # Tag-based collision filtering
+        tag_a = getattr(a, "collision_tag", None)
+        tag_b = getattr(b, "collision_tag", None)
+        if (tag_a, tag_b) not in self.rules and (tag_b, tag_a) not in self.rules:
+            return
+
+        if (getattr(a, "state", 0) >= InteractionState.INTANGIBLE or
+                getattr(b, "state", 0) >= InteractionState.INTANGIBLE):
+            return
+
+        # Overlap test
+        if not a_hitbox.rect.colliderect(b_hitbox.rect):
+            return
+
+        collisions.append((a, b))
+        DebugLogger.state(
+            f"Collision: {type(a).__name__} ({tag_a}) <-> {type(b).__name__} ({tag_b})",
+            category="collision",
+        )
+
+        # Let entities_animation handle their reactions
+        try:
+            if hasattr(a, "on_collision"):
+                a.on_collision(b)
+
+            if hasattr(b, "on_collision"):
+                b.on_collision(a)
+
+        except Exception as e:
+            DebugLogger.warn(
+                f"[CollisionManager] Exception during collision between "
+                f"{type(a).__name__} and {type(b).__name__}: {e}",
+                category="collision"
+            )
+
     # ===========================================================
     # Debug Visualization
     # ===========================================================
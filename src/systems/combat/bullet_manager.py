@@ -14,7 +14,7 @@ Responsibilities
 import pygame
 from src.entities.bullets.bullet_straight import StraightBullet
 from src.core.debug.debug_logger import DebugLogger
-from src.entities.entity_state import LifecycleState
+from src.entities.entity_state import CollisionTags, ALIVE, DEAD
 
 
 class BulletManager:
@@ -48,14 +48,14 @@ class BulletManager:
                 damage=damage, hitbox_scale=hitbox_scale,
             )
 
-        bullet.collision_tag = f"{owner}_bullet"
+        bullet.collision_tag = CollisionTags.bullet(owner)
         self._register_hitbox(bullet)
         return bullet
 
     def _reset_bullet(self, b, pos, vel, image, color, radius, owner, damage, hitbox_scale):
         """Reset an existing bullet from the pool."""
-        b.pos.update(pos)
-        b.vel.update(vel)
+        b.pos = pos
+        b.vel = vel
 
         # Only update image if explicitly provided (not None)
         if image is not None:
@@ -69,8 +69,8 @@ class BulletManager:
         b.radius = radius
         b.owner = owner
         b.damage = damage
-        b.death_state = LifecycleState.ALIVE
-        b.collision_tag = f"{owner}_bullet"
+        b.death_state = ALIVE
+        b.collision_tag = CollisionTags.bullet(owner)
 
     # ===========================================================
     # Pool Prewarming
@@ -98,8 +98,8 @@ class BulletManager:
                 radius=radius, owner=owner,
                 damage=damage, hitbox_scale=hitbox_scale
             )
-            bullet.death_state = LifecycleState.DEAD
-            bullet.collision_tag = f"{owner}_bullet"
+            bullet.death_state = DEAD
+            bullet.collision_tag = CollisionTags.bullet(owner)
             self.pool.append(bullet)
 
         DebugLogger.state(f"Prewarmed {count} bullets for [{owner}] pool", category="combat")
@@ -156,7 +156,7 @@ class BulletManager:
                 damage=damage, hitbox_scale=hitbox_scale,
             )
 
-        bullet.collision_tag = f"{owner}_bullet"
+        bullet.collision_tag = CollisionTags.bullet(owner)
         self.active.append(bullet)
         self._register_hitbox(bullet)
         return bullet
@@ -173,6 +173,11 @@ class BulletManager:
         """
         next_active = []
 
+        # Screen bounds are loop-invariant: resolve once per frame, not per bullet
+        surface = pygame.display.get_surface()
+        screen_rect = surface.get_rect() if surface else None
+        on_screen = screen_rect.colliderect if screen_rect else None
+
         for bullet in self.active:
             try:
                 bullet.update(dt)
@@ -181,31 +186,21 @@ class BulletManager:
                     f"[BulletUpdateError] {type(bullet).__name__}: {e}",
                     category="combat"
                 )
-                bullet.death_state = LifecycleState.DEAD
+                bullet.death_state = DEAD
                 self._unregister_hitbox(bullet)
                 self.pool.append(bullet)
                 continue
 
             # Lifecycle
-            if bullet.death_state < LifecycleState.DEAD and not self._is_offscreen(bullet):
+            if bullet.death_state < DEAD and (on_screen is None or on_screen(bullet.rect)):
                 next_active.append(bullet)
             else:
-                bullet.death_state = LifecycleState.DEAD
+                bullet.death_state = DEAD
                 self._unregister_hitbox(bullet)
                 self.pool.append(bullet)
 
         self.active = next_active
 
-    # ===========================================================
-    # Offscreen Check Helper
-    # ===========================================================
-    def _is_offscreen(self, bullet) -> bool:
-        """Return True if the bullet has moved beyond the visible area."""
-        surface = pygame.display.get_surface()
-        if not surface:
-            return False
-        return not surface.get_rect().colliderect(bullet.rect)
-
     # ===========================================================
     # Rendering
     # ===========================================================
@@ -243,7 +238,7 @@ class BulletManager:
         before = len(self.active)
         cleaned = []
         for b in self.active:
-            if b.death_state < LifecycleState.DEAD:
+            if b.death_state < DEAD:
                 cleaned.append(b)
             else:
                 self._unregister_hitbox(b)
@@ -12,10 +12,13 @@ Responsibilities
 - Handle per-frame update and render passes for all active entities_animation.
 """
 
+from operator import attrgetter
+
 from src.core.debug.debug_logger import DebugLogger
 from src.entities.enemies.enemy_straight import EnemyStraight
+from src.entities.items.item_health import HealthPickup  # noqa: F401 - registers item:health
 from src.entities.entity_registry import EntityRegistry
-from src.entities.entity_state import LifecycleState
+from src.entities.entity_state import DEAD
 
 
 # ===========================================================
@@ -28,6 +31,9 @@ ENEMY_TYPES = {
     # "shooter": EnemyShooter,
 }
 
+# C-level accessor for the bulk liveness pre-scan in cleanup()
+_death_state_of = attrgetter("death_state")
+
 
 class SpawnManager:
     """
@@ -38,6 +44,9 @@ class SpawnManager:
     It handles initialization, updates, rendering, and lifecycle cleanup.
     """
 
+    # Upper bound per pool; extra despawned entities are left to the GC
+    MAX_POOL_SIZE = 512
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -100,6 +109,9 @@ class SpawnManager:
                 # DebugLogger.warn(f"Failed to spawn {category}: '{type_name}'")
                 return None
 
+        # Remember which pool this entity belongs to for _return_to_pool()
+        entity._pool_key = key
+
         DebugLogger.system(f"Spawned {type(entity).__name__} ID: {id(entity)}", category="entity")
 
         self.entities.append(entity)
@@ -144,7 +156,8 @@ class SpawnManager:
             entity = EntityRegistry.create(category, type_name, -1000, -1000,
                                            draw_manager=self.draw_manager)
             if entity:
-                entity.death_state = LifecycleState.DEAD  # Mark as inactive
+                entity.death_state = DEAD  # Mark as inactive
+                entity._pool_key = key
                 self.pools[key].append(entity)
 
     def _get_from_pool(self, category: str, type_name: str):
@@ -158,17 +171,23 @@ class SpawnManager:
 
     def _return_to_pool(self, entity):
         """Return entity to its pool."""
-        category = getattr(entity, "category", None)
-        type_name = self._get_entity_type_name(entity)
-
-        if not category or not type_name:
-            return False
-
-        key = (category, type_name)
-
-        if key in self.pool_enabled and self.pool_enabled[key]:
-            entity.death_state = LifecycleState.DEAD
-            self.pools[key].append(entity)
+        key = getattr(entity, "_pool_key", None)
+        if key is None:
+            # Fallback: derive key from category + class name convention
+            category = getattr(entity, "category", None)
+            type_name = self._get_entity_type_name(entity)
+
+            if not category or not type_name:
+                return False
+
+            key = (category, type_name)
+
+        if self.pool_enabled.get(key):
+            pool = self.pools[key]
+            if len(pool) >= self.MAX_POOL_SIZE:
+                return False
+            entity.death_state = DEAD
+            pool.append(entity)
             return True
 
         return False
@@ -198,7 +217,7 @@ class SpawnManager:
 
         # Update positions and hitboxes before collision checks
         for entity in self.entities:
-            if entity.death_state < LifecycleState.DEAD:
+            if entity.death_state < DEAD:
                 entity.update(dt)
 
     # ===========================================================
@@ -224,12 +243,17 @@ class SpawnManager:
         if not self.entities:  # Early exit
             return
 
+        # Most frames nothing died: confirm with a map/attrgetter scan that
+        # runs in C, and skip the Python-level compaction loop entirely
+        if max(map(_death_state_of, self.entities)) < DEAD:
+            return
+
         total_before = len(self.entities)
         i = 0
         returned_to_pool = 0
 
         for e in self.entities:
-            if e.death_state < LifecycleState.DEAD:
+            if e.death_state < DEAD:
                 self.entities[i] = e
                 i += 1
             else:
@@ -275,7 +299,7 @@ class SpawnManager:
         Clears all active entities_animation and pool data.
         """
         for e in self.entities:
-            e.death_state = LifecycleState.DEAD
+            e.death_state = DEAD
             self._return_to_pool(e)
 
         self.entities.clear()
@@ -73,6 +73,11 @@ class UIButton(BaseUI):
 
         self.draw_manager = None
 
+        # Last composited surface and the look it was built for; an idle
+        # button re-queues this instead of redrawing every frame
+        self._surface_key = None
+        self._surface = None
+
         # DebugLogger.system(f"Initialized at ({x}, {y}) with action '{action}'")
 
     # ===========================================================
@@ -130,11 +135,13 @@ class UIButton(BaseUI):
         Create and return a pygame.Surface representing the button’s current state.
         Handles background fill, border, and optional icon rendering.
 
+        The surface is only rebuilt when the visible state changes (fill color
+        after the hover fade settles, border, icon, size); otherwise the cached
+        composite is returned.
+
         Returns:
             pygame.Surface: The rendered button surface.
         """
-        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-
         # Determine color based on state
         if not self.enabled:
             color = (80, 80, 80)
@@ -143,6 +150,15 @@ class UIButton(BaseUI):
         else:
             color = self._lerp_color(self.color, self.hover_color, self.hover_t)
 
+        # draw_manager is part of the look: it decides between the loaded
+        # icon and the vector fallback, and UIManager assigns it after init
+        key = (color, self.border_color, self.border_width, self.icon_type,
+               self.rect.size, self.draw_manager)
+        if key == self._surface_key:
+            return self._surface
+
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+
         # Background
         pygame.draw.rect(surf, color, surf.get_rect())
 
@@ -160,6 +176,8 @@ class UIButton(BaseUI):
                 self._draw_icon(surf, self.icon_type, self.border_color)
 
         # DebugLogger.state(f"Rendered '{self.action}' at {self.rect.topleft}")
+        self._surface_key = key
+        self._surface = surf
         return surf
 
     # ===========================================================